@@ -1,11 +1,64 @@
 import random
+import hashlib
+import numbers
+import struct
+from datetime import datetime
+from codecrack_engine import (pack_code, unpack_code, format_code, digit_counters, packed_score,
+                              SNAPSHOT_HISTORY_ENTRY, SWAR_MAX_CODE_LENGTH)
+
+# Settings for each difficulty level offered in the GUI and daily puzzle
+DIFFICULTY_SETTINGS = {
+    "Easy": {"code_length": 4, "max_guesses": 10, "allow_duplicates": False},
+    "Medium": {"code_length": 5, "max_guesses": 10, "allow_duplicates": True},
+    "Hard": {"code_length": 6, "max_guesses": 10, "allow_duplicates": True}
+}
+# columns of game_stats.csv, the game-level rows the predictors train on
+STATS_HEADER = ["difficulty", "result", "time_taken", "guesses_used", "hints_used",
+                "code_length", "allow_duplicates", "secret_code"]
+
+MULTI_CODE_COUNTS = [1, 2, 4, 8]  # codes played at once offered in the GUI
+MULTI_CODE_EXTRA_GUESSES = 2  # extra guesses per additional code in multi-code games
+
+SNAPSHOT_MAGIC = b"CCGM"
+SNAPSHOT_VERSION = 1
+# magic, version, code length, max guesses, flags (1 = duplicates allowed, 2 = won),
+# first digit, last digit, guesses remaining, history length; then the packed secret
+SNAPSHOT_HEADER = struct.Struct("<4sBBBBhhBBQ")
+
+
+def daily_seed(day=None):
+    """Returns the RNG seed for a day's puzzle (a date or "YYYY-MM-DD", default today)."""
+    if day is None:
+        day = datetime.now()
+    if not isinstance(day, str):
+        day = day.strftime("%Y-%m-%d")
+    return int(hashlib.sha256(day.encode()).hexdigest(), 16) % (10 ** 8)
+
+
+def _check_settings(code_length, max_guesses, digit_range):
+    """Raises ValueError for game settings that cannot be played."""
+    if not (isinstance(code_length, int) and code_length > 0):
+        raise ValueError("Code length must be a positive integer.")
+    if not (isinstance(max_guesses, int) and max_guesses > 0):
+        raise ValueError("Max guesses must be a positive integer.")
+    if not (isinstance(digit_range, tuple) and len(digit_range) == 2 and all(isinstance(i, int) for i in digit_range)):
+        raise ValueError("Digit range must be a tuple of two integers.")
+    if code_length > SWAR_MAX_CODE_LENGTH or not 0 < digit_range[1] - digit_range[0] + 1 <= 16:
+        raise ValueError(f"Codes are limited to {SWAR_MAX_CODE_LENGTH} positions and 16 digits.")
+
 
 class CodeCrackGame:
     """
     The logic engine for CodeCrack game (similar to Mastermind).
     Generates a secret code and evaluates user guesses.
+
+    The secret and the guesses in history are packed ints (see codecrack_engine.pack_code);
+    secret_code and format_code() give their digits for display.
     """
 
+    __slots__ = ("code_length", "max_guesses", "allow_duplicates", "digits", "secret", "_secret_counters",
+                 "guesses_remaining", "history", "won")
+
     def __init__(self, code_length=4, max_guesses=10, allow_duplicates=True, digit_range=(1, 6)):
         """
         Initializes game settings and secret code.
@@ -16,12 +69,7 @@ class CodeCrackGame:
             allow_duplicates (bool): Whether duplicate digits are allowed.
             digit_range (tuple): The digit range (min, max) inclusive.
         """
-        if not (isinstance(code_length, int) and code_length > 0):
-            raise ValueError("Code length must be a positive integer.")
-        if not (isinstance(max_guesses, int) and max_guesses > 0):
-            raise ValueError("Max guesses must be a positive integer.")
-        if not (isinstance(digit_range, tuple) and len(digit_range) == 2 and all(isinstance(i, int) for i in digit_range)):
-            raise ValueError("Digit range must be a tuple of two integers.")
+        _check_settings(code_length, max_guesses, digit_range)
 
         self.code_length = code_length
         self.max_guesses = max_guesses
@@ -29,9 +77,27 @@ class CodeCrackGame:
         self.digits = [str(i) for i in range(digit_range[0], digit_range[1] + 1)]
         self.secret_code = self._generate_secret_code()
         self.guesses_remaining = max_guesses
-        self.history = []  # (guess_list, correct, misplaced)
+        self.history = []  # (packed_guess, correct, misplaced)
         self.won = False
 
+    @property
+    def secret_code(self):
+        """The secret code as a list of digit strings."""
+        return unpack_code(self.secret, self.digits, self.code_length)
+
+    @secret_code.setter
+    def secret_code(self, code):
+        self.secret = self.pack(code)
+        self._secret_counters = digit_counters(self.secret, self.code_length)
+
+    def pack(self, code):
+        """Packs a code given as a string or list of digits; packed ints (NumPy ones too) pass through."""
+        return int(code) if isinstance(code, numbers.Integral) else pack_code(code, self.digits)
+
+    def format_code(self, code):
+        """Returns a packed code as its display string."""
+        return format_code(code, self.digits, self.code_length)
+
     def _generate_secret_code(self):
         """Generates a secret code based on rules."""
         if self.allow_duplicates:
@@ -39,6 +105,14 @@ class CodeCrackGame:
         else:
             return random.sample(self.digits, k=self.code_length)
 
+    def _generate_daily_code(self, day=None):
+        """Generates a day's secret code from a date-based seed, so every player gets the same one."""
+        rng = random.Random(daily_seed(day))
+        if self.allow_duplicates:
+            return [rng.choice(self.digits) for _ in range(self.code_length)]
+        else:
+            return rng.sample(self.digits, k=self.code_length)
+
     def _validate_guess(self, guess_str):
         """
         Validates a guess string.
@@ -59,11 +133,138 @@ class CodeCrackGame:
 
     def _get_feedback(self, guess):
         """
-        Compares the guess to the secret code.
+        Compares a packed guess to the secret code.
 
         Returns:
             (int, int): Tuple of (correct_position, correct_digit_wrong_position)
         """
-        correct = sum(g == s for g, s in zip(guess, self.secret_code))
-        misplaced = sum(min(guess.count(d), self.secret_code.count(d)) for d in set(guess)) - correct
+        return packed_score(guess, self.secret, self.code_length, secret_counters=self._secret_counters)
+
+    def make_guess(self, guess):
+        """
+        Scores a validated guess (string, list of digits or packed int) and records it in the history.
+
+        Returns:
+            (int, int): Tuple of (correct_position, correct_digit_wrong_position)
+        """
+        guess = self.pack(guess)
+        correct, misplaced = self._get_feedback(guess)
+        self.history.append((guess, correct, misplaced))
+        self.guesses_remaining -= 1
+        if correct == self.code_length:
+            self.won = True
         return correct, misplaced
+
+    def to_bytes(self):
+        """
+        Serializes the game into a compact, versioned snapshot: settings, the packed secret
+        and every guess as a packed code plus one feedback byte.
+        """
+        if self.max_guesses > 255:
+            raise ValueError("Game settings are too large for a snapshot.")
+        flags = int(self.allow_duplicates) | int(self.won) << 1
+        parts = [SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, self.code_length, self.max_guesses,
+                                      flags, int(self.digits[0]), int(self.digits[-1]), self.guesses_remaining,
+                                      len(self.history), self.secret)]
+        for guess, correct, misplaced in self.history:
+            parts.append(SNAPSHOT_HISTORY_ENTRY.pack(guess, correct * (self.code_length + 1) + misplaced))
+        return b"".join(parts)
+
+    @classmethod
+    def from_bytes(cls, data):
+        """Rebuilds a game from to_bytes() output without generating a new secret."""
+        (magic, version, code_length, max_guesses, flags, first_digit, last_digit,
+         guesses_remaining, num_guesses, secret) = SNAPSHOT_HEADER.unpack_from(data)
+        if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION:
+            raise ValueError("Not a CodeCrack game snapshot, or an unsupported version.")
+        game = cls.__new__(cls)
+        game.code_length = code_length
+        game.max_guesses = max_guesses
+        game.allow_duplicates = bool(flags & 1)
+        game.won = bool(flags & 2)
+        game.digits = [str(i) for i in range(first_digit, last_digit + 1)]
+        game.secret_code = secret
+        game.guesses_remaining = guesses_remaining
+        game.history = []
+        for offset in range(SNAPSHOT_HEADER.size, SNAPSHOT_HEADER.size + num_guesses * SNAPSHOT_HISTORY_ENTRY.size,
+                            SNAPSHOT_HISTORY_ENTRY.size):
+            packed, feedback = SNAPSHOT_HISTORY_ENTRY.unpack_from(data, offset)
+            game.history.append((packed, *divmod(feedback, code_length + 1)))
+        return game
+
+
+class MultiCodeGame:
+    """
+    Multi-code mode: every guess is scored against several independent secret codes, each
+    with its own board. A board is finished once its code is cracked; the game is won when
+    all of them are.
+
+    Not a CodeCrackGame: there is no single secret_code, and history entries are
+    (packed_guess, feedbacks) with one (correct, misplaced) or None per secret. Guess
+    validation and code packing are shared with CodeCrackGame.
+    """
+
+    __slots__ = ("num_secrets", "code_length", "max_guesses", "allow_duplicates", "digits", "secrets",
+                 "_secrets_counters", "guesses_remaining", "history", "boards", "solved", "won")
+
+    pack = CodeCrackGame.pack
+    format_code = CodeCrackGame.format_code
+    _generate_secret_code = CodeCrackGame._generate_secret_code
+    _validate_guess = CodeCrackGame._validate_guess
+
+    def __init__(self, num_secrets=4, code_length=4, max_guesses=None, allow_duplicates=True, digit_range=(1, 6)):
+        """
+        Initializes game settings and the secret codes.
+
+        Args:
+            num_secrets (int): Number of secret codes played at once.
+            max_guesses (int): Maximum number of guesses allowed; defaults to 10 plus
+                MULTI_CODE_EXTRA_GUESSES for every code after the first.
+            code_length, allow_duplicates, digit_range: As for CodeCrackGame.
+        """
+        if not (isinstance(num_secrets, int) and num_secrets > 0):
+            raise ValueError("Number of secret codes must be a positive integer.")
+        if max_guesses is None:
+            max_guesses = 10 + MULTI_CODE_EXTRA_GUESSES * (num_secrets - 1)
+        _check_settings(code_length, max_guesses, digit_range)
+
+        self.num_secrets = num_secrets
+        self.code_length = code_length
+        self.max_guesses = max_guesses
+        self.allow_duplicates = allow_duplicates
+        self.digits = [str(i) for i in range(digit_range[0], digit_range[1] + 1)]
+        self.secrets = [self.pack(self._generate_secret_code()) for _ in range(num_secrets)]
+        self._secrets_counters = [digit_counters(secret, code_length) for secret in self.secrets]
+        self.guesses_remaining = max_guesses
+        self.history = []  # (packed_guess, feedbacks)
+        self.boards = [[] for _ in range(num_secrets)]  # per secret: (packed_guess, correct, misplaced)
+        self.solved = [False] * num_secrets
+        self.won = False
+
+    @property
+    def secret_codes(self):
+        """Every secret code as a list of digit strings."""
+        return [unpack_code(secret, self.digits, self.code_length) for secret in self.secrets]
+
+    def make_guess(self, guess):
+        """
+        Scores a validated guess against every secret that is not cracked yet.
+
+        Returns:
+            list: (correct_position, correct_digit_wrong_position) per secret, None for cracked ones
+        """
+        guess = self.pack(guess)
+        guess_counters = digit_counters(guess, self.code_length)
+        feedbacks = []
+        for k, (secret, counters) in enumerate(zip(self.secrets, self._secrets_counters)):
+            if self.solved[k]:
+                feedbacks.append(None)
+                continue
+            correct, misplaced = packed_score(guess, secret, self.code_length, guess_counters, counters)
+            self.boards[k].append((guess, correct, misplaced))
+            self.solved[k] = correct == self.code_length
+            feedbacks.append((correct, misplaced))
+        self.history.append((guess, feedbacks))
+        self.guesses_remaining -= 1
+        self.won = all(self.solved)
+        return feedbacks
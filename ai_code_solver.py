@@ -1,85 +1,22 @@
 import tkinter as tk
 from tkinter import messagebox, ttk
-from itertools import product, permutations
-import random
 import time
 import csv
 import joblib
 import os
-import hashlib
+import struct
 from datetime import datetime, timedelta
 from ml_hint_model import MLHintModel
+from CodeCrackGame import CodeCrackGame, MultiCodeGame, DIFFICULTY_SETTINGS, MULTI_CODE_COUNTS
+from codecrack_engine import CodeCrackSolver, MultiCodeSolver
+from daily_calendar import daily_puzzle, lookup_daily
+from leaderboard import Leaderboard, default_player
 from sklearn.preprocessing import LabelEncoder
 from PIL import Image, ImageTk
 
-# Game Logic
-class CodeCrackGame:
-    def __init__(self, code_length=4, max_guesses=10, allow_duplicates=True, digit_range=(1, 6)):
-        self.code_length = code_length
-        self.max_guesses = max_guesses
-        self.allow_duplicates = allow_duplicates
-        self.digits = [str(i) for i in range(digit_range[0], digit_range[1] + 1)]
-        self.secret_code = self._generate_secret_code()
-        self.guesses_remaining = max_guesses
-        self.history = []
-        self.won = False
-
-    def _generate_secret_code(self):
-        if self.allow_duplicates:
-            return random.choices(self.digits, k=self.code_length)
-        else:
-            return random.sample(self.digits, k=self.code_length)
-        
-    def _generate_daily_code(self):
-        today = datetime.now().strftime("%Y-%m-%d")
-        seed = int(hashlib.sha256(today.encode()).hexdigest(), 16) % (10 ** 8)
-        rng = random.Random(seed)
-        if self.allow_duplicates:
-            return [rng.choice(self.digits) for _ in range(self.code_length)]
-        else:
-            return rng.sample(self.digits, k=self.code_length)
-
-    def _validate_guess(self, guess_str):
-        if len(guess_str) != self.code_length:
-            return False, f"Guess must be {self.code_length} digits."
-        if not all(c in self.digits for c in guess_str):
-            return False, f"Digits must be between {self.digits[0]} and {self.digits[-1]}."
-        if not self.allow_duplicates and len(set(guess_str)) != self.code_length:
-            return False, "Duplicates not allowed."
-        return True, ""
-
-    def _get_feedback(self, guess):
-        correct = sum(g == s for g, s in zip(guess, self.secret_code))
-        misplaced = sum(min(guess.count(d), self.secret_code.count(d)) for d in set(guess)) - correct
-        return correct, misplaced
-
-# AI Solver Logic (Rule-based)
-class CodeCrackSolver:
-    def __init__(self, code_length=4, digits='123456', allow_duplicates=True):
-        self.code_length = code_length
-        self.digits = digits
-        self.allow_duplicates = allow_duplicates
-        self.history = []
-        self.all_possible = self._generate_all_codes()
-
-    def _generate_all_codes(self):
-        if self.allow_duplicates:
-            return [''.join(p) for p in product(self.digits, repeat=self.code_length)]
-        else:
-            return [''.join(p) for p in permutations(self.digits, r=self.code_length)]
-
-    def _feedback(self, guess, secret):
-        correct = sum(g == s for g, s in zip(guess, secret))
-        misplaced = sum(min(guess.count(d), secret.count(d)) for d in set(guess)) - correct
-        return correct, misplaced
-
-    def filter(self, guess, correct, misplaced):
-        self.history.append((guess, correct, misplaced))
-        self.all_possible = [code for code in self.all_possible
-                             if self._feedback(code, guess) == (correct, misplaced)]
-
-    def next_guess(self):
-        return self.all_possible[0] if self.all_possible else None
+DAILY_SAVE_FILE = "daily_save.bin"
+# date, level index, elapsed seconds, hints used, game snapshot length; then game and solver snapshots
+DAILY_SAVE_HEADER = struct.Struct("<10sBdBI")
 
 # GUI with AI and Hints
 class CodeCrackGUI:
@@ -95,11 +32,7 @@ class CodeCrackGUI:
         self.load_streaks()
         self.theme = "Light"  # Default
 
-        self.difficulty_settings = {
-            "Easy": {"code_length": 4, "max_guesses": 10, "allow_duplicates": False},
-            "Medium": {"code_length": 5, "max_guesses": 10, "allow_duplicates": True},
-            "Hard": {"code_length": 6, "max_guesses": 10, "allow_duplicates": True}
-        }
+        self.difficulty_settings = DIFFICULTY_SETTINGS
 
         self.create_start_menu()
     def load_streaks(self):
@@ -169,6 +102,15 @@ class CodeCrackGUI:
         self.difficulty_dropdown.current(0)
         self.difficulty_dropdown.pack(pady=10)
 
+        self.codes_label = tk.Label(self.master, text="Codes at Once:", font=("Helvetica", 12))
+        self.codes_label.pack(pady=(5, 0))
+
+        self.codes_var = tk.StringVar()
+        self.codes_dropdown = ttk.Combobox(self.master, textvariable=self.codes_var, state="readonly", width=5)
+        self.codes_dropdown['values'] = MULTI_CODE_COUNTS
+        self.codes_dropdown.current(0)
+        self.codes_dropdown.pack(pady=5)
+
         self.start_btn = tk.Button(self.master, text="Start Game", command=self.start_game)
         self.start_btn.pack(pady=20)
         self.daily_btn = tk.Button(self.master, text="Daily Puzzle", command=self.start_daily_game)
@@ -200,12 +142,25 @@ class CodeCrackGUI:
 
     def start_game(self):
         settings = self.difficulty_settings[self.difficulty_var.get()]
-        self.game = CodeCrackGame(**settings)
+        num_codes = int(self.codes_var.get())
+        self.multi_mode = num_codes > 1
         self.current_level = self.difficulty_var.get()
-        self.solver = CodeCrackSolver(code_length=self.game.code_length,
-                                       digits=''.join(self.game.digits),
-                                       allow_duplicates=self.game.allow_duplicates)
-        self.ml_model = MLHintModel(self.game.digits, self.game.code_length, max_hints=5)
+        if self.multi_mode:
+            # One guess is scored against every code, each with its own board
+            self.game = MultiCodeGame(num_secrets=num_codes, code_length=settings["code_length"],
+                                      allow_duplicates=settings["allow_duplicates"])
+            self.solver = MultiCodeSolver(num_secrets=num_codes, code_length=self.game.code_length,
+                                          digits=''.join(self.game.digits),
+                                          allow_duplicates=self.game.allow_duplicates)
+            self.current_level += f" ×{num_codes}"
+            self.master.geometry(f"{max(500, 190 * min(num_codes, 4))}x{650 + 150 * (num_codes > 4)}")
+        else:
+            self.game = CodeCrackGame(**settings)
+            self.solver = CodeCrackSolver(code_length=self.game.code_length,
+                                           digits=''.join(self.game.digits),
+                                           allow_duplicates=self.game.allow_duplicates)
+            self.master.geometry("500x650")
+        self.ml_model = MLHintModel(self.game.digits, self.game.code_length, max_hints=5, solver=self.solver)
         self.start_time = time.time()
         self.daily_mode = False
 
@@ -249,7 +204,8 @@ class CodeCrackGUI:
         info_btn = tk.Button(self.master, text="❔", font=("Helvetica", 10), command=self.show_rules)
         info_btn.place(x=460, y=10, width=30, height=30)
 
-        self.instructions_label = tk.Label(self.master, text=f"Guess the {self.game.code_length}-digit code.\n Select the numbers between 1 - 6 \n No duplicate digits (Easy), duplicates allowed (Medium/Hard)", font=("Helvetica", 10))
+        target = f"{self.game.num_secrets} {self.game.code_length}-digit codes at once" if getattr(self, 'multi_mode', False) else f"{self.game.code_length}-digit code"
+        self.instructions_label = tk.Label(self.master, text=f"Guess the {target}.\n Select the numbers between 1 - 6 \n No duplicate digits (Easy), duplicates allowed (Medium/Hard)", font=("Helvetica", 10))
         self.instructions_label.pack(pady=5)
 
         self.guess_entry = tk.Entry(self.master, font=("Helvetica", 14), width=10, justify="center")
@@ -289,7 +245,7 @@ class CodeCrackGUI:
             self.label_encoder.fit(["Easy", "Medium", "Hard"])
 
     def update_win_prediction(self):
-        if self.model is None:
+        if self.model is None or getattr(self, 'multi_mode', False):
             self.win_chance_label.config(text="Win Chance: --")
             return
 
@@ -310,11 +266,15 @@ class CodeCrackGUI:
         for widget in self.board_frame.winfo_children():
             widget.destroy()
 
+        if getattr(self, 'multi_mode', False):
+            self.update_multi_boards()
+            return
+
         header = tk.Label(self.board_frame, text="Guess   |  Correct  |  Misplaced", font=("Helvetica", 12, "bold"))
         header.pack()
 
         for guess, correct, misplaced in self.game.history:
-            guess_str = ''.join(guess)
+            guess_str = self.game.format_code(guess)
             emoji = f"{'✔️' * correct}{'↔️' * misplaced}{'✖️' * (self.game.code_length - correct - misplaced)}"
             row_text = f"{guess_str:^8} | {correct:^8} | {misplaced:^8}  {emoji}"
 
@@ -328,11 +288,30 @@ class CodeCrackGUI:
 
         self.hints_left_label.config(text=f"Hints left: {self.ml_model.max_hints - self.ml_model.hints_used}")
 
+    def update_multi_boards(self):
+        # One small board per secret code, four to a row
+        for k, board in enumerate(self.game.boards):
+            frame = tk.Frame(self.board_frame, bd=1, relief="groove")
+            frame.grid(row=k // 4, column=k % 4, padx=4, pady=4, sticky="n")
+            title = f"Code {k + 1}" + (" ✅" if self.game.solved[k] else "")
+            tk.Label(frame, text=title, font=("Helvetica", 10, "bold")).pack()
+            for guess, correct, misplaced in board:
+                bg_color = "lightgreen" if correct == self.game.code_length else ("lightyellow" if correct > 0 or misplaced > 0 else "lightgrey")
+                row_text = f"{self.game.format_code(guess)} {correct}✔ {misplaced}↔"
+                tk.Label(frame, text=row_text, font=("Courier", 10), bg=bg_color).pack(fill='x')
+
+        guesses_left = tk.Label(self.board_frame, text=f"Guesses left: {self.game.guesses_remaining}", font=("Helvetica", 10, "italic"))
+        guesses_left.grid(row=(len(self.game.boards) - 1) // 4 + 1, column=0, columnspan=4)
+        self.hints_left_label.config(text=f"Hints left: {self.ml_model.max_hints - self.ml_model.hints_used}")
+
     def show_stats_popup(self, result):
         time_taken = time.time() - self.start_time
         total_guesses = len(self.game.history)
         hints_used = self.ml_model.hints_used
-        secret_code = ''.join(self.game.secret_code)
+        if getattr(self, 'multi_mode', False):
+            secret_code = ', '.join(''.join(code) for code in self.game.secret_codes)
+        else:
+            secret_code = ''.join(self.game.secret_code)
 
         message = (
             f"Result: {'✅ You Won!' if result == 'win' else '❌ You Lost'}\n"
@@ -341,8 +320,15 @@ class CodeCrackGUI:
             f"Guesses Used: {total_guesses}/{self.game.max_guesses}\n"
             f"Hints Used: {hints_used}/{self.ml_model.max_hints}"
         )
+        is_daily = "Daily Puzzle" in self.title_label.cget("text")
+        if is_daily:
+            today = datetime.now().strftime("%Y-%m-%d")
+            player = default_player()
+            with Leaderboard() as board:
+                board.submit(player, today, result, total_guesses, round(time_taken, 1))
+                message += f"\nToday's Rank: {board.rank(player, today)} of {board.size(today)}"
         messagebox.showinfo("Game Stats", message)
-        if "Daily Puzzle" in self.title_label.cget("text"):
+        if is_daily:
     
             file_exists = os.path.exists("daily_scores.csv")
             with open("daily_scores.csv", "a", newline="") as f:
@@ -365,13 +351,21 @@ class CodeCrackGUI:
             messagebox.showwarning("Invalid Guess", msg)
             return
 
-        guess_list = list(guess)
-        correct, misplaced = self.game._get_feedback(guess_list)
-        self.game.history.append((guess_list, correct, misplaced))
+        if getattr(self, 'multi_mode', False):
+            self.submit_multi_guess(guess)
+            return
+
+        correct, misplaced = self.game.make_guess(guess)
         self.solver.filter(guess, correct, misplaced)
-        self.game.guesses_remaining -= 1
         self.guess_entry.delete(0, tk.END)
 
+        # Autosave the daily puzzle so a crash or closed window doesn't lose it
+        if getattr(self, 'daily_mode', False):
+            if correct == self.game.code_length or self.game.guesses_remaining == 0:
+                self.clear_daily_progress()
+            else:
+                self.save_daily_progress()
+
         self.update_board()
         self.update_win_prediction()
 
@@ -405,6 +399,17 @@ class CodeCrackGUI:
             self.update_board()
             self.update_win_prediction()
 
+    def submit_multi_guess(self, guess):
+        feedbacks = self.game.make_guess(guess)
+        self.solver.filter(guess, feedbacks)
+        self.guess_entry.delete(0, tk.END)
+        self.update_board()
+
+        if self.game.won or self.game.guesses_remaining == 0:
+            self.disable_game()
+            self.show_stats_popup("win" if self.game.won else "loss")
+            self.create_start_menu()
+
     def get_hint(self):
         suggestion = self.ml_model.suggest(self.game.history)
         if suggestion:
@@ -413,17 +418,49 @@ class CodeCrackGUI:
         else:
             messagebox.showinfo("No Hints Left", "You have used all your hints!")
         self.hints_left_label.config(text=f"Hints left: {self.ml_model.max_hints - self.ml_model.hints_used}")
+        if getattr(self, 'daily_mode', False):
+            self.save_daily_progress()  # Keep the hint count, or a restart would hand out hints again
 
     def disable_game(self):
         self.submit_btn.config(state="disabled")
         self.guess_entry.config(state="disabled")
         self.hint_btn.config(state="disabled")
 
+    def save_daily_progress(self):
+        game_bytes = self.game.to_bytes()
+        header = DAILY_SAVE_HEADER.pack(self.daily_date.encode("ascii"), list(self.difficulty_settings).index(self.current_level),
+                                        time.time() - self.start_time, self.ml_model.hints_used, len(game_bytes))
+        with open(DAILY_SAVE_FILE + ".tmp", "wb") as f:
+            f.write(header + game_bytes + self.solver.to_bytes())
+        os.replace(DAILY_SAVE_FILE + ".tmp", DAILY_SAVE_FILE)
+
+    def load_daily_progress(self, today):
+        """Returns (level, game, solver, elapsed, hints_used) of an unfinished puzzle for today, or None."""
+        if not os.path.exists(DAILY_SAVE_FILE):
+            return None
+        try:
+            with open(DAILY_SAVE_FILE, "rb") as f:
+                data = f.read()
+            date, level, elapsed, hints_used, game_size = DAILY_SAVE_HEADER.unpack_from(data)
+            if date.decode("ascii") != today:
+                return None
+            start = DAILY_SAVE_HEADER.size
+            game = CodeCrackGame.from_bytes(data[start:start + game_size])
+            solver = CodeCrackSolver.from_bytes(data[start + game_size:])
+        except (struct.error, ValueError):
+            return None  # Corrupt or outdated save, start fresh
+        return list(self.difficulty_settings)[level], game, solver, elapsed, hints_used
+
+    def clear_daily_progress(self):
+        if os.path.exists(DAILY_SAVE_FILE):
+            os.remove(DAILY_SAVE_FILE)
+
     def start_daily_game(self):
         today = datetime.now().strftime("%Y-%m-%d")
+        saved = self.load_daily_progress(today)
 
-        # Check if today's puzzle was already played
-        if not getattr(self, 'creator_mode', False):  # Only enforce if not creator mode
+        # Check if today's puzzle was already played (an unfinished saved puzzle can be resumed)
+        if saved is None and not getattr(self, 'creator_mode', False):  # Only enforce if not creator mode
             if os.path.exists("daily_played.txt"):
                 with open("daily_played.txt") as f:
                     if today in f.read():
@@ -434,21 +471,31 @@ class CodeCrackGUI:
            f.write(today)
 
         # Setup Daily Game
-        # Randomly choose a level each day using date-based seed for consistency
-        today = datetime.now().strftime("%Y-%m-%d")
-        seed = int(hashlib.sha256(today.encode()).hexdigest(), 16) % (10 ** 8)
-        rng = random.Random(seed)
-        level = rng.choice(["Easy", "Medium", "Hard"])
-        settings = self.difficulty_settings[level]
+        if saved:
+            level, self.game, self.solver, elapsed, hints_used = saved
+        else:
+            # Use the precomputed calendar if it covers today, else derive the puzzle from the date seed
+            entry = lookup_daily(today)
+            if entry:
+                level, secret_code = entry["level"], entry["secret_code"]
+            else:
+                level, secret_code = daily_puzzle(today)
+            self.game = CodeCrackGame(**self.difficulty_settings[level])
+            self.game.secret_code = secret_code
+            self.solver = CodeCrackSolver(code_length=self.game.code_length,
+                                           digits=''.join(self.game.digits),
+                                           allow_duplicates=self.game.allow_duplicates)
+            elapsed, hints_used = 0, 0
         self.current_level = level  # ✅ So level display works in create_widgets
-        self.game = CodeCrackGame(**settings)
-        self.game.secret_code = self.game._generate_daily_code()
-        self.solver = CodeCrackSolver(code_length=self.game.code_length,
-                                       digits=''.join(self.game.digits),
-                                       allow_duplicates=self.game.allow_duplicates)
-        self.ml_model = MLHintModel(self.game.digits, self.game.code_length, max_hints=5)
-        self.start_time = time.time()
+        self.ml_model = MLHintModel(self.game.digits, self.game.code_length, max_hints=5, solver=self.solver)
+        self.ml_model.hints_used = hints_used
+        self.start_time = time.time() - elapsed
         self.daily_mode = True
+        self.multi_mode = False
+        self.master.geometry("500x650")
+        self.daily_date = today
+        # Save right away: daily_played.txt is already written, so an unsaved puzzle could never be resumed
+        self.save_daily_progress()
 
         self.theme = self.theme_var.get()
         self.apply_theme()
@@ -547,6 +594,7 @@ class CodeCrackGUI:
             "• No duplicate digits (Easy), duplicates allowed (Medium/Hard).\n"
             "• You have limited guesses — use them wisely!\n"
             "• You can request hints using the AI hint button.\n"
+            "• With more than one code at once, every guess is scored against each code on its own board.\n"
             "• Daily Puzzle resets every midnight.\n"
         )
         messagebox.showinfo("How to Play", rules)
@@ -1,31 +1,5 @@
-from CodeCrackGame import CodeCrackGame
-from itertools import product
-
-class CodeCrackSolver:
-    def __init__(self, digits, code_length=4, allow_duplicates=True):
-        self.digits = digits
-        self.code_length = code_length
-        self.allow_duplicates = allow_duplicates
-        self.history = []
-        self.all_codes = self._generate_all_possible_codes()
-
-    def _generate_all_possible_codes(self):
-        if self.allow_duplicates:
-            return [''.join(p) for p in product(self.digits, repeat=self.code_length)]
-        else:
-            from itertools import permutations
-            return [''.join(p) for p in permutations(self.digits, r=self.code_length)]
-
-    def _feedback(self, guess, code):
-        correct = sum(g == c for g, c in zip(guess, code))
-        misplaced = sum(min(guess.count(d), code.count(d)) for d in set(guess)) - correct
-        return correct, misplaced
-
-    def filter_possible_codes(self, guess, correct, misplaced):
-        self.all_codes = [code for code in self.all_codes if self._feedback(guess, code) == (correct, misplaced)]
-
-    def next_guess(self):
-        return self.all_codes[0] if self.all_codes else None
+from CodeCrackGame import CodeCrackGame, MultiCodeGame
+from codecrack_engine import CodeCrackSolver, MultiCodeSolver
 
 def play_vs_ai(code_length=4, max_guesses=10, allow_duplicates=True, digit_range=(1, 6)):
     game = CodeCrackGame(code_length=code_length, max_guesses=max_guesses,
@@ -41,10 +15,8 @@ def play_vs_ai(code_length=4, max_guesses=10, allow_duplicates=True, digit_range
             print("AI has no valid guesses left. Aborting.")
             break
 
-        correct, misplaced = game._get_feedback(list(guess))
-        game.history.append((list(guess), correct, misplaced))
-        game.guesses_remaining -= 1
-        ai.filter_possible_codes(guess, correct, misplaced)
+        correct, misplaced = game.make_guess(guess)
+        ai.filter(guess, correct, misplaced)
 
         print(f"AI Guess: {guess} | Correct: {correct} | Misplaced: {misplaced} | Guesses Left: {game.guesses_remaining}")
 
@@ -55,6 +27,41 @@ def play_vs_ai(code_length=4, max_guesses=10, allow_duplicates=True, digit_range
     if game.guesses_remaining == 0 and not game.won:
         print(f"\n❌ AI failed to crack the code. Secret was: {''.join(game.secret_code)}")
 
+def play_vs_ai_multi(num_secrets=4, code_length=4, max_guesses=None, allow_duplicates=True, digit_range=(1, 6)):
+    game = MultiCodeGame(num_secrets=num_secrets, code_length=code_length, max_guesses=max_guesses,
+                         allow_duplicates=allow_duplicates, digit_range=digit_range)
+    ai = MultiCodeSolver(num_secrets=num_secrets, digits=game.digits, code_length=code_length,
+                         allow_duplicates=allow_duplicates)
+
+    print(f"[AI] Trying to crack {num_secrets} {code_length}-digit codes at once. Digits: {game.digits[0]}-{game.digits[-1]}")
+    print(f"Secret Codes (hidden): {' '.join('*' * code_length for _ in range(num_secrets))}\n")
+
+    while game.guesses_remaining > 0:
+        guess = ai.best_guess()
+        if guess is None:
+            print("AI has no valid guesses left. Aborting.")
+            break
+
+        feedbacks = game.make_guess(guess)
+        ai.filter(guess, feedbacks)
+
+        boards = " | ".join("solved" if fb is None else f"{fb[0]}C {fb[1]}M" for fb in feedbacks)
+        print(f"AI Guess: {guess} | {boards} | Guesses Left: {game.guesses_remaining}")
+
+        if game.won:
+            print(f"\n🎉 AI cracked all {num_secrets} codes!")
+            break
+
+    if not game.won:
+        secrets = ', '.join(game.format_code(secret) for secret in game.secrets)
+        print(f"\n❌ AI failed to crack every code. Secrets were: {secrets}")
+
+def select_num_codes():
+    choice = input("How many codes at once? (1-8, Enter for 1): ").strip()
+    if choice.isdigit() and 1 <= int(choice) <= 8:
+        return int(choice)
+    return 1
+
 def select_difficulty():
     print("Select Difficulty Level:")
     print("1. Easy (4 digits, duplicates allowed)")
@@ -74,4 +81,8 @@ def select_difficulty():
 
 if __name__ == "__main__":
     code_length, max_guesses, allow_duplicates = select_difficulty()
-    play_vs_ai(code_length=code_length, max_guesses=max_guesses, allow_duplicates=allow_duplicates, digit_range=(1, 6))
+    num_codes = select_num_codes()
+    if num_codes > 1:
+        play_vs_ai_multi(num_secrets=num_codes, code_length=code_length, allow_duplicates=allow_duplicates, digit_range=(1, 6))
+    else:
+        play_vs_ai(code_length=code_length, max_guesses=max_guesses, allow_duplicates=allow_duplicates, digit_range=(1, 6))
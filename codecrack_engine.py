@@ -0,0 +1,855 @@
+"""
+Shared CodeCrack engine: code spaces, pluggable feedback backends and the rule-based solver.
+
+Feedback is encoded as a single small int, ``correct * (code_length + 1) + misplaced``,
+so backends can store and compare it in bulk. Codes can also be packed into one int,
+4 bits per position (pack_code()), and scored with bit-parallel arithmetic on ints or
+uint64 arrays alike (packed_score()). Five backends are registered:
+
+    python  - pure Python, always available.
+    numpy   - vectorized scoring of one guess against many codes.
+    table   - a precomputed guess x secret feedback table in memory (small code spaces).
+    mmap    - the same table cached on disk and memory-mapped read-only, so every process
+              shares one copy; tables too large to store whole are split into row blocks
+              built ahead of time by ``python codecrack_engine.py --build-tables``, and
+              rows whose block is not built yet are scored like the numpy backend.
+    packed  - packed_score() over a uint64 array of packed codes.
+
+The backend is picked from the code-space size (and, for large spaces, whether their
+table blocks are built) unless a name is passed explicitly
+or set through the ``CODECRACK_BACKEND`` environment variable. Disk tables live in
+``CODECRACK_TABLE_DIR`` (default ~/.cache/codecrack).
+"""
+import argparse
+import numbers
+import os
+import random
+import struct
+import tempfile
+import time
+from collections import Counter
+from functools import lru_cache
+from itertools import product, permutations
+
+try:
+    import numpy as np
+except ImportError:  # NumPy backends are optional
+    np = None
+
+BACKEND_ENV_VAR = "CODECRACK_BACKEND"
+TABLE_DIR_ENV_VAR = "CODECRACK_TABLE_DIR"
+TABLE_FORMAT_VERSION = 1
+TABLE_MAX_CODES = 2000  # 2000 x 2000 uint8 table = 4 MB
+MMAP_FULL_MAX_CODES = 8000  # larger disk tables are tiled; 8000 x 8000 = 64 MB
+MMAP_BLOCK_ROWS = 256  # rows per tile; 256 x 46656 (6 digits, duplicates) = 12 MB
+# (digits, code_length, allow_duplicates) of the spaces --build-tables prepares (the GUI levels)
+TABLE_BUILD_SPACES = [("123456", 4, False), ("123456", 5, True), ("123456", 6, True)]
+MATRIX_MAX_CELLS = 2 ** 24  # largest guess x candidate block scored at once
+BEST_GUESS_POOL = 1000  # most guesses best_guess() compares per move
+MOVE_TIME_BUDGET = 0.05  # seconds sampled_guess() may spend per move
+SAMPLE_GUESSES = 16  # fresh guesses sampled_guess() adds each round
+SAMPLE_SECRETS = 64  # secrets sampled_guess() scores against in its first round
+MULTI_GUESS_POOL = 300  # most guesses MultiCodeSolver compares per move
+
+SOLVER_SNAPSHOT_MAGIC = b"CCSV"
+SOLVER_SNAPSHOT_VERSION = 1
+# magic, version, code length, number of digits, duplicates allowed, history length, candidate count
+SOLVER_SNAPSHOT_HEADER = struct.Struct("<4sBBB?BI")
+SNAPSHOT_HISTORY_ENTRY = struct.Struct("<QB")  # packed guess, encoded feedback
+ALL_CANDIDATES = 0xFFFFFFFF  # candidate count meaning "the whole code space"
+
+NIBBLES_LOW = 0x1111111111111111  # lowest bit of every 4-bit lane
+NIBBLES_HIGH = 0x8888888888888888  # highest bit of every 4-bit lane
+SWAR_MAX_CODE_LENGTH = 7  # digit counters must stay below a lane's high bit
+
+FEEDBACK_BACKENDS = {}
+
+
+def score(guess, secret):
+    """
+    Compares a guess to a secret code.
+
+    Args:
+        guess (str | list): The guessed digits.
+        secret (str | list): The secret digits.
+
+    Returns:
+        (int, int): Tuple of (correct_position, correct_digit_wrong_position)
+    """
+    correct = sum(g == s for g, s in zip(guess, secret))
+    misplaced = sum(min(guess.count(d), secret.count(d)) for d in set(guess)) - correct
+    return correct, misplaced
+
+
+def pack_code(code, digits):
+    """
+    Packs a code into one int: the index of each digit in digits, 4 bits per position,
+    first position in the lowest bits. Supports up to 16 positions and 16 digits.
+    """
+    value = 0
+    for pos, d in enumerate(code):
+        value |= digits.index(d) << (4 * pos)
+    return value
+
+
+def unpack_code(value, digits, code_length):
+    """Inverse of pack_code(); returns the code as a list of digit strings."""
+    return [digits[(value >> (4 * pos)) & 0xF] for pos in range(code_length)]
+
+
+def format_code(value, digits, code_length):
+    """Turns a packed code into its display string."""
+    return ''.join(unpack_code(int(value), digits, code_length))
+
+
+def _swar_constants(*values):
+    """The lane constants, typed as uint64 unless every value is a Python int."""
+    if not all(type(value) is int for value in values):
+        return np.uint64(1), np.uint64(NIBBLES_LOW), np.uint64(NIBBLES_HIGH)
+    return 1, NIBBLES_LOW, NIBBLES_HIGH
+
+
+def digit_counters(code, code_length):
+    """
+    Counts the digits of a packed code into 4-bit lanes: lane d holds how often digit index
+    d occurs. Works on Python ints and element-wise on uint64 arrays.
+    """
+    one = _swar_constants(code)[0]
+    counters = code & 0
+    for pos in range(code_length):
+        counters += one << (((code >> (4 * pos)) & 0xF) << 2)
+    return counters
+
+
+def packed_score(guess, secret, code_length, guess_counters=None, secret_counters=None):
+    """
+    score() for packed codes, computed with bit-parallel (SWAR) arithmetic so the same
+    expressions run on Python ints and element-wise on uint64 arrays.
+
+    Exact matches are the zero lanes of guess ^ secret. Common digits are the lane-wise
+    minimum of both codes' digit counters, taken with a borrow-free subtraction per lane
+    and summed with one multiplication. Counters may be passed in when precomputed.
+
+    Returns:
+        (int, int): Tuple of (correct_position, correct_digit_wrong_position), or two arrays
+    """
+    if code_length > SWAR_MAX_CODE_LENGTH:
+        raise ValueError(f"Packed scoring supports codes of up to {SWAR_MAX_CODE_LENGTH} digits.")
+    _, low, high = _swar_constants(guess, secret)
+    if guess_counters is None:
+        guess_counters = digit_counters(guess, code_length)
+    if secret_counters is None:
+        secret_counters = digit_counters(secret, code_length)
+    diff = guess ^ secret
+    diff = (diff | diff >> 1 | diff >> 2 | diff >> 3) & (low >> (64 - 4 * code_length))
+    correct = code_length - ((diff * low) >> 60 & 0xF)
+    # Lanes where guess_counters >= secret_counters keep their high bit after the subtraction
+    secret_smaller = ((guess_counters | high) - secret_counters & high) >> 3
+    common = guess_counters ^ (guess_counters ^ secret_counters) & secret_smaller * 0xF
+    return correct, ((common * low) >> 60 & 0xF) - correct
+
+
+def score_many(guesses, secrets):
+    """
+    Vectorized score() for NumPy digit arrays of shape (n, code_length) holding values 0-9,
+    so logged codes can be replayed without building a CodeSpace.
+
+    Returns:
+        (ndarray, ndarray): correct_position and correct_digit_wrong_position per row
+    """
+    code_length = guesses.shape[1]
+    if code_length <= SWAR_MAX_CODE_LENGTH:
+        shifts = np.arange(0, 4 * code_length, 4, dtype=np.uint64)
+        return packed_score((guesses.astype(np.uint64) << shifts).sum(axis=1, dtype=np.uint64),
+                            (secrets.astype(np.uint64) << shifts).sum(axis=1, dtype=np.uint64),
+                            code_length)
+    correct = (guesses == secrets).sum(axis=1)
+    common = np.zeros(len(guesses), dtype=np.intp)
+    for d in range(10):
+        common += np.minimum((guesses == d).sum(axis=1), (secrets == d).sum(axis=1))
+    return correct, common - correct
+
+
+class CodeSpace:
+    """
+    Every code that can be played under one set of rules, in a fixed index order.
+    Use get_code_space() so that spaces (and their backends) are shared.
+    """
+
+    def __init__(self, digits, code_length, allow_duplicates=True):
+        self.digits = ''.join(digits)
+        self.code_length = code_length
+        self.allow_duplicates = allow_duplicates
+        if allow_duplicates:
+            codes = product(self.digits, repeat=code_length)
+        else:
+            codes = permutations(self.digits, r=code_length)
+        self.codes = [''.join(p) for p in codes]
+        self._index = {code: i for i, code in enumerate(self.codes)}
+        self.packed = [pack_code(code, self.digits) for code in self.codes]
+        self._packed_index = {value: i for i, value in enumerate(self.packed)}
+        self._backends = {}
+        self._openings = {}
+
+    def __len__(self):
+        return len(self.codes)
+
+    def index(self, code):
+        """Returns the index of a code given as a string, list of digits or packed int."""
+        if isinstance(code, numbers.Integral):
+            try:
+                return self._packed_index[int(code)]
+            except KeyError:
+                raise ValueError(f"Packed code {int(code):#x} is not part of this code space.") from None
+        code = ''.join(code)
+        try:
+            return self._index[code]
+        except KeyError:
+            raise ValueError(f"Code {code} is not part of this code space.") from None
+
+    def encode_feedback(self, correct, misplaced):
+        return correct * (self.code_length + 1) + misplaced
+
+    def decode_feedback(self, value):
+        return divmod(int(value), self.code_length + 1)
+
+
+@lru_cache(maxsize=None)
+def _cached_code_space(digits, code_length, allow_duplicates):
+    return CodeSpace(digits, code_length, allow_duplicates)
+
+
+def get_code_space(digits, code_length, allow_duplicates=True):
+    """Returns the shared CodeSpace for these rules, building it on first use."""
+    return _cached_code_space(''.join(digits), code_length, bool(allow_duplicates))
+
+
+def register_backend(cls):
+    """Class decorator adding a FeedbackBackend subclass to the registry under cls.name."""
+    FEEDBACK_BACKENDS[cls.name] = cls
+    return cls
+
+
+class FeedbackBackend:
+    """
+    Scores guesses against sets of candidate codes in one CodeSpace.
+
+    Candidates are code indices; each backend chooses its own container for them
+    (a list or an array), so callers should only pass back what the backend returned.
+    Passing candidates=None means every code in the space.
+    """
+
+    name = None
+
+    def __init__(self, space):
+        self.space = space
+
+    @classmethod
+    def available(cls):
+        return True
+
+    def all_candidates(self):
+        raise NotImplementedError
+
+    def feedback_many(self, guess_idx, candidates=None):
+        """Returns the encoded feedback of one guess against every candidate."""
+        raise NotImplementedError
+
+    def filter(self, candidates, guess_idx, feedback):
+        """Keeps the candidates that would have produced this encoded feedback."""
+        raise NotImplementedError
+
+    def feedback_pairs(self, guess_idxs, secret_idxs):
+        """Returns the encoded feedback of guess_idxs[i] against secret_idxs[i], element-wise."""
+        raise NotImplementedError
+
+    def feedback_matrix(self, guess_idxs, candidates=None):
+        """Returns one feedback_many() row per guess."""
+        return [self.feedback_many(guess_idx, candidates) for guess_idx in guess_idxs]
+
+    def partition_counts(self, guess_idxs, candidates=None):
+        """Returns, per guess, how many distinct feedbacks it produces against the candidates."""
+        return [len(set(row)) for row in self.feedback_matrix(guess_idxs, candidates)]
+
+    def partition_scores(self, guess_idxs, candidates=None):
+        """
+        Returns, per guess, the sum of squared group sizes its feedback splits the candidates
+        into (proportional to the expected number of candidates left; lower is better).
+        """
+        return [sum(n * n for n in Counter(row).values())
+                for row in self.feedback_matrix(guess_idxs, candidates)]
+
+
+@register_backend
+class PythonBackend(FeedbackBackend):
+    name = "python"
+
+    def all_candidates(self):
+        return list(range(len(self.space)))
+
+    def feedback_many(self, guess_idx, candidates=None):
+        codes = self.space.codes
+        guess = codes[guess_idx]
+        encode = self.space.encode_feedback
+        if candidates is None:
+            return [encode(*score(guess, code)) for code in codes]
+        return [encode(*score(guess, codes[i])) for i in candidates]
+
+    def filter(self, candidates, guess_idx, feedback):
+        return [i for i, fb in zip(candidates, self.feedback_many(guess_idx, candidates))
+                if fb == feedback]
+
+    def feedback_pairs(self, guess_idxs, secret_idxs):
+        codes = self.space.codes
+        encode = self.space.encode_feedback
+        return [encode(*score(codes[g], codes[s])) for g, s in zip(guess_idxs, secret_idxs)]
+
+
+@register_backend
+class NumpyBackend(FeedbackBackend):
+    """
+    Stores codes column-wise: columns[pos] holds the digit at pos of every code and
+    counts[d] how often digit d occurs in every code, so scoring is a short loop of
+    whole-array operations.
+    """
+
+    name = "numpy"
+
+    def __init__(self, space):
+        super().__init__(space)
+        positions = {d: i for i, d in enumerate(space.digits)}
+        code_digits = np.array([[positions[c] for c in code] for code in space.codes],
+                               dtype=np.uint8).reshape(len(space), space.code_length)
+        self.columns = np.ascontiguousarray(code_digits.T)
+        self.counts = np.stack([(code_digits == d).sum(axis=1, dtype=np.uint8)
+                                for d in range(len(space.digits))])
+
+    @classmethod
+    def available(cls):
+        return np is not None
+
+    def all_candidates(self):
+        return np.arange(len(self.space), dtype=np.intp)
+
+    def _score(self, guess_columns, guess_counts, columns, counts):
+        # correct * (code_length + 1) + (common - correct) == correct * code_length + common
+        feedback = np.zeros(columns.shape[1:], dtype=np.uint8)
+        for pos in range(self.space.code_length):
+            feedback += columns[pos] == guess_columns[pos]
+        feedback *= np.uint8(self.space.code_length)
+        for d in range(len(self.space.digits)):
+            feedback += np.minimum(counts[d], guess_counts[d])
+        return feedback
+
+    def feedback_many(self, guess_idx, candidates=None):
+        columns, counts = self.columns, self.counts
+        if candidates is not None:
+            columns, counts = columns[:, candidates], counts[:, candidates]
+        return self._score(self.columns[:, guess_idx], self.counts[:, guess_idx], columns, counts)
+
+    def filter(self, candidates, guess_idx, feedback):
+        return candidates[self.feedback_many(guess_idx, candidates) == feedback]
+
+    def feedback_pairs(self, guess_idxs, secret_idxs):
+        return self._score(self.columns[:, guess_idxs], self.counts[:, guess_idxs],
+                           self.columns[:, secret_idxs], self.counts[:, secret_idxs])
+
+    def feedback_matrix(self, guess_idxs, candidates=None):
+        columns, counts = self.columns, self.counts
+        if candidates is not None:
+            columns, counts = columns[:, candidates], counts[:, candidates]
+        matrix = np.empty((len(guess_idxs), columns.shape[1]), dtype=np.uint8)
+        for row, guess_idx in enumerate(guess_idxs):
+            matrix[row] = self._score(self.columns[:, guess_idx], self.counts[:, guess_idx], columns, counts)
+        return matrix
+
+    def _partition_sizes(self, guess_idxs, candidates=None):
+        """Returns a (guesses, feedbacks) array counting the candidates behind each feedback."""
+        guess_idxs = np.asarray(guess_idxs, dtype=np.intp)
+        size = len(self.space) if candidates is None else len(candidates)
+        num_feedbacks = (self.space.code_length + 1) ** 2
+        sizes = np.empty((len(guess_idxs), num_feedbacks), dtype=np.int64)
+        step = max(1, MATRIX_MAX_CELLS // max(size, 1))
+        for start in range(0, len(guess_idxs), step):
+            matrix = self.feedback_matrix(guess_idxs[start:start + step], candidates)
+            keys = matrix + np.arange(len(matrix))[:, None] * num_feedbacks
+            sizes[start:start + step] = np.bincount(keys.ravel(), minlength=len(matrix) * num_feedbacks
+                                                    ).reshape(len(matrix), num_feedbacks)
+        return sizes
+
+    def partition_counts(self, guess_idxs, candidates=None):
+        return (self._partition_sizes(guess_idxs, candidates) > 0).sum(axis=1)
+
+    def partition_scores(self, guess_idxs, candidates=None):
+        return (self._partition_sizes(guess_idxs, candidates) ** 2).sum(axis=1)
+
+
+@register_backend
+class TableBackend(NumpyBackend):
+    name = "table"
+
+    def __init__(self, space):
+        super().__init__(space)
+        self.table = np.empty((len(space), len(space)), dtype=np.uint8)
+        for guess_idx in range(len(space)):
+            self.table[guess_idx] = super().feedback_many(guess_idx)
+
+    def feedback_many(self, guess_idx, candidates=None):
+        if candidates is None:
+            return self.table[guess_idx]
+        return self.table[guess_idx, candidates]
+
+    def feedback_pairs(self, guess_idxs, secret_idxs):
+        return self.table[guess_idxs, secret_idxs]
+
+    def feedback_matrix(self, guess_idxs, candidates=None):
+        if candidates is None:
+            return self.table[guess_idxs]
+        return self.table[np.ix_(guess_idxs, candidates)]
+
+
+@register_backend
+class PackedBackend(NumpyBackend):
+    """
+    Stores every code as one packed uint64 plus its packed digit counters and scores with
+    packed_score(), so a guess is compared to all candidates in a fixed number of
+    whole-array integer operations. Limited to codes of up to SWAR_MAX_CODE_LENGTH digits.
+    """
+
+    name = "packed"
+
+    def __init__(self, space):
+        FeedbackBackend.__init__(self, space)
+        if space.code_length > SWAR_MAX_CODE_LENGTH:
+            raise ValueError(f"The packed backend supports codes of up to {SWAR_MAX_CODE_LENGTH} digits.")
+        self.packed = np.array(space.packed, dtype=np.uint64)
+        self.counters = digit_counters(self.packed, space.code_length)
+
+    def _packed_feedback(self, guesses, guess_counters, secrets, secret_counters):
+        correct, misplaced = packed_score(guesses, secrets, self.space.code_length, guess_counters, secret_counters)
+        return (correct * np.uint64(self.space.code_length + 1) + misplaced).astype(np.uint8)
+
+    def feedback_many(self, guess_idx, candidates=None):
+        packed, counters = self.packed, self.counters
+        if candidates is not None:
+            packed, counters = packed[candidates], counters[candidates]
+        return self._packed_feedback(self.packed[guess_idx], self.counters[guess_idx], packed, counters)
+
+    def feedback_pairs(self, guess_idxs, secret_idxs):
+        return self._packed_feedback(self.packed[guess_idxs], self.counters[guess_idxs],
+                                     self.packed[secret_idxs], self.counters[secret_idxs])
+
+    def feedback_matrix(self, guess_idxs, candidates=None):
+        packed, counters = self.packed, self.counters
+        if candidates is not None:
+            packed, counters = packed[candidates], counters[candidates]
+        matrix = np.empty((len(guess_idxs), len(packed)), dtype=np.uint8)
+        for row, guess_idx in enumerate(guess_idxs):
+            matrix[row] = self._packed_feedback(self.packed[guess_idx], self.counters[guess_idx], packed, counters)
+        return matrix
+
+
+def table_dir():
+    return os.environ.get(TABLE_DIR_ENV_VAR) or os.path.join(os.path.expanduser("~"), ".cache", "codecrack")
+
+
+@register_backend
+class MappedTableBackend(NumpyBackend):
+    """
+    Feedback table stored as .npy files keyed by (code_length, digits, allow_duplicates)
+    and opened with mmap_mode="r". Spaces up to full_max_codes are one file, built when the
+    backend is created if missing (in memory if the cache directory is not writable).
+    Larger ones are split into files of block_rows rows that only build_blocks() writes;
+    scoring maps the blocks that exist and scores rows of missing ones directly.
+    """
+
+    name = "mmap"
+
+    def __init__(self, space, full_max_codes=MMAP_FULL_MAX_CODES, block_rows=MMAP_BLOCK_ROWS):
+        super().__init__(space)
+        self.path_prefix = table_path_prefix(space)
+        self.block_rows = block_rows
+        self.blocks = {}
+        self.table = None
+        if len(space) <= full_max_codes:
+            self.table = self._load(self.path_prefix + ".npy", 0, len(space))
+
+    def _load(self, path, first, stop):
+        if not os.path.exists(path):
+            rows = super().feedback_matrix(range(first, stop))
+            try:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+                with os.fdopen(fd, "wb") as f:
+                    np.save(f, rows)
+                os.chmod(temp_path, 0o644)  # mkstemp files are private; tables are shared
+                os.replace(temp_path, path)  # Atomic, so concurrent builders are harmless
+            except OSError:
+                return rows
+        return np.load(path, mmap_mode="r")
+
+    def _block_path(self, block):
+        return f"{self.path_prefix}_rows{self.block_rows}_{block}.npy"
+
+    @property
+    def num_blocks(self):
+        return -(-len(self.space) // self.block_rows)
+
+    def build_blocks(self):
+        """Writes every missing block file; meant for a batch step, not for scoring calls."""
+        for block in range(self.num_blocks):
+            first = block * self.block_rows
+            self.blocks[block] = self._load(self._block_path(block), first,
+                                            min(first + self.block_rows, len(self.space)))
+
+    def _block(self, block):
+        """The mapped block, or None if it has not been built yet."""
+        if block not in self.blocks:
+            path = self._block_path(block)
+            if not os.path.exists(path):
+                return None
+            self.blocks[block] = np.load(path, mmap_mode="r")
+        return self.blocks[block]
+
+    def _row(self, guess_idx):
+        if self.table is not None:
+            return self.table[guess_idx]
+        block = self._block(guess_idx // self.block_rows)
+        return None if block is None else block[guess_idx % self.block_rows]
+
+    def feedback_many(self, guess_idx, candidates=None):
+        row = self._row(guess_idx)
+        if row is None:
+            return super().feedback_many(guess_idx, candidates)
+        return row if candidates is None else row[candidates]
+
+    def feedback_pairs(self, guess_idxs, secret_idxs):
+        guess_idxs, secret_idxs = np.asarray(guess_idxs), np.asarray(secret_idxs)
+        if self.table is not None:
+            return self.table[guess_idxs, secret_idxs]
+        feedback = np.empty(len(guess_idxs), dtype=np.uint8)
+        blocks = guess_idxs // self.block_rows
+        for block in np.unique(blocks):
+            rows = blocks == block
+            mapped = self._block(block)
+            if mapped is None:
+                feedback[rows] = super().feedback_pairs(guess_idxs[rows], secret_idxs[rows])
+            else:
+                feedback[rows] = mapped[guess_idxs[rows] % self.block_rows, secret_idxs[rows]]
+        return feedback
+
+    def feedback_matrix(self, guess_idxs, candidates=None):
+        if self.table is not None:
+            if candidates is None:
+                return self.table[guess_idxs]
+            return self.table[np.ix_(guess_idxs, candidates)]
+        size = len(self.space) if candidates is None else len(candidates)
+        matrix = np.empty((len(guess_idxs), size), dtype=np.uint8)
+        for row, guess_idx in enumerate(guess_idxs):
+            matrix[row] = self.feedback_many(guess_idx, candidates)
+        return matrix
+
+
+def table_path_prefix(space):
+    """Path of a space's disk table, without the block suffix and extension."""
+    duplicates = "dup" if space.allow_duplicates else "nodup"
+    return os.path.join(table_dir(), f"feedback_v{TABLE_FORMAT_VERSION}_{space.digits}_{space.code_length}_{duplicates}")
+
+
+def tables_built(space, block_rows=MMAP_BLOCK_ROWS):
+    """Whether every block of a large space's disk table has been built."""
+    prefix = table_path_prefix(space)
+    return all(os.path.exists(f"{prefix}_rows{block_rows}_{block}.npy")
+               for block in range(-(-len(space) // block_rows)))
+
+
+def build_tables(configs=TABLE_BUILD_SPACES):
+    """Builds the disk tables (whole or in blocks) of the given spaces ahead of play."""
+    for digits, code_length, allow_duplicates in configs:
+        space = get_code_space(digits, code_length, allow_duplicates)
+        backend = MappedTableBackend(space)
+        if backend.table is None:
+            backend.build_blocks()
+
+
+def default_backend_name(space):
+    """Picks a backend from the number of codes (and built disk tables) when none is configured."""
+    if np is None:
+        return "python"
+    if len(space) <= TABLE_MAX_CODES:
+        return "table"
+    if len(space) <= MMAP_FULL_MAX_CODES or tables_built(space):
+        return "mmap"
+    return "numpy"
+
+
+def get_backend(space, name=None):
+    """
+    Returns the (cached) feedback backend for a code space.
+
+    Args:
+        space (CodeSpace): The code space to score in.
+        name (str): Backend name; defaults to $CODECRACK_BACKEND, then to the size-based choice.
+    """
+    name = name or os.environ.get(BACKEND_ENV_VAR) or default_backend_name(space)
+    if name not in FEEDBACK_BACKENDS:
+        raise ValueError(f"Unknown feedback backend '{name}'. Choose from: {', '.join(FEEDBACK_BACKENDS)}.")
+    if name not in space._backends:
+        backend_cls = FEEDBACK_BACKENDS[name]
+        if not backend_cls.available():
+            raise ImportError(f"The '{name}' feedback backend requires NumPy.")
+        space._backends[name] = backend_cls(space)
+    return space._backends[name]
+
+
+# AI Solver Logic (Rule-based)
+class CodeCrackSolver:
+    """
+    Keeps the set of codes consistent with all feedback so far and guesses the first one.
+    """
+
+    def __init__(self, code_length=4, digits='123456', allow_duplicates=True, backend=None):
+        self.code_length = code_length
+        self.digits = ''.join(digits)
+        self.allow_duplicates = allow_duplicates
+        self.space = get_code_space(self.digits, code_length, allow_duplicates)
+        self.backend = get_backend(self.space, backend)
+        self.history = []
+        self.candidates = self.backend.all_candidates()
+
+    @property
+    def all_possible(self):
+        """The remaining candidate codes as strings."""
+        return [self.space.codes[i] for i in self.candidates]
+
+    def filter(self, guess, correct, misplaced):
+        """Narrows the candidates by a guess (string, list of digits or packed int) and its feedback."""
+        guess_idx = self.space.index(guess)
+        self.history.append((self.space.packed[guess_idx], correct, misplaced))
+        self.candidates = self.backend.filter(self.candidates, guess_idx,
+                                              self.space.encode_feedback(correct, misplaced))
+
+    def next_guess(self):
+        return self.space.codes[self.candidates[0]] if len(self.candidates) else None
+
+    def best_guess(self, pool_size=BEST_GUESS_POOL):
+        """
+        Returns the remaining candidate whose feedback splits the candidates into the most
+        groups. With more than pool_size candidates, only an evenly spaced subset is compared.
+        """
+        if not len(self.candidates):
+            return None
+        if not self.history and pool_size in self.space._openings:
+            return self.space._openings[pool_size]
+        pool = self.candidates[::max(1, len(self.candidates) // pool_size)]
+        counts = list(self.backend.partition_counts(pool, self.candidates))
+        guess = self.space.codes[pool[counts.index(max(counts))]]
+        if not self.history:
+            self.space._openings[pool_size] = guess
+        return guess
+
+    def to_bytes(self):
+        """
+        Serializes the solver into a compact, versioned snapshot: the code-space key, the
+        history as packed guesses with feedback bytes, and the candidate indices (or a marker
+        for "every code" before the first guess).
+        """
+        everything = len(self.candidates) == len(self.space)
+        parts = [
+            SOLVER_SNAPSHOT_HEADER.pack(SOLVER_SNAPSHOT_MAGIC, SOLVER_SNAPSHOT_VERSION, self.code_length,
+                                        len(self.digits), self.allow_duplicates, len(self.history),
+                                        ALL_CANDIDATES if everything else len(self.candidates)),
+            self.digits.encode("ascii"),
+        ]
+        for guess, correct, misplaced in self.history:
+            parts.append(SNAPSHOT_HISTORY_ENTRY.pack(guess, self.space.encode_feedback(correct, misplaced)))
+        if not everything:
+            if isinstance(self.candidates, list):
+                parts.append(struct.pack(f"<{len(self.candidates)}I", *self.candidates))
+            else:
+                parts.append(self.candidates.astype("<u4").tobytes())
+        return b"".join(parts)
+
+    @classmethod
+    def from_bytes(cls, data, backend=None):
+        """Rebuilds a solver from to_bytes() output, using any backend."""
+        (magic, version, code_length, num_digits, allow_duplicates,
+         num_guesses, num_candidates) = SOLVER_SNAPSHOT_HEADER.unpack_from(data)
+        if magic != SOLVER_SNAPSHOT_MAGIC or version != SOLVER_SNAPSHOT_VERSION:
+            raise ValueError("Not a CodeCrack solver snapshot, or an unsupported version.")
+        offset = SOLVER_SNAPSHOT_HEADER.size
+        digits = data[offset:offset + num_digits].decode("ascii")
+        offset += num_digits
+        solver = cls(code_length, digits, allow_duplicates, backend)
+        for _ in range(num_guesses):
+            packed, feedback = SNAPSHOT_HISTORY_ENTRY.unpack_from(data, offset)
+            offset += SNAPSHOT_HISTORY_ENTRY.size
+            solver.history.append((packed, *solver.space.decode_feedback(feedback)))
+        if num_candidates != ALL_CANDIDATES:
+            if isinstance(solver.candidates, list):
+                solver.candidates = list(struct.unpack_from(f"<{num_candidates}I", data, offset))
+            else:
+                solver.candidates = np.frombuffer(data, dtype="<u4", count=num_candidates,
+                                                  offset=offset).astype(np.intp)
+        return solver
+
+    def sampled_guess(self, time_budget=MOVE_TIME_BUDGET, rng=None):
+        """
+        Anytime Monte Carlo guess for large candidate sets.
+
+        Each round scores the better half of the previous round's guesses plus a few fresh
+        random candidates against a random sample of candidate secrets, then doubles the
+        sample. Rounds stop once the next one would overrun time_budget seconds, or once
+        every candidate has been scored exactly; the best guess of the last round is returned.
+        """
+        start = time.perf_counter()
+        rng = rng or random
+        size = len(self.candidates)
+        if size <= 2:
+            return self.next_guess()
+
+        best, survivors, tried = 0, [], set()
+        num_secrets = SAMPLE_SECRETS
+        while True:
+            round_start = time.perf_counter()
+            fresh = [i for i in rng.sample(range(size), min(SAMPLE_GUESSES, size)) if i not in tried]
+            tried.update(fresh)
+            pool = survivors + fresh
+            secrets = rng.sample(range(size), num_secrets) if num_secrets < size else range(size)
+            scores = list(self.backend.partition_scores([self.candidates[i] for i in pool],
+                                                        [self.candidates[i] for i in secrets]))
+            order = sorted(range(len(pool)), key=scores.__getitem__)
+            best = pool[order[0]]
+            survivors = [pool[i] for i in order[:max(1, len(order) // 2)]]
+
+            now = time.perf_counter()
+            exhaustive = num_secrets >= size and len(tried) >= size
+            # The next round scores about twice as many guess/secret pairs
+            if exhaustive or now - start + 3 * (now - round_start) > time_budget:
+                return self.space.codes[self.candidates[best]]
+            num_secrets *= 2
+
+
+class MultiCodeSolver:
+    """
+    Solves several secrets that are all scored against the same guesses. Keeps one
+    candidate set per secret over a shared code space and backend, and picks the guess
+    whose feedback splits the unsolved sets best together.
+    """
+
+    def __init__(self, num_secrets=4, code_length=4, digits='123456', allow_duplicates=True, backend=None):
+        self.num_secrets = num_secrets
+        self.code_length = code_length
+        self.digits = ''.join(digits)
+        self.allow_duplicates = allow_duplicates
+        self.space = get_code_space(self.digits, code_length, allow_duplicates)
+        self.backend = get_backend(self.space, backend)
+        self.history = []  # (packed_guess, [(correct, misplaced) or None per secret])
+        self.candidates = [self.backend.all_candidates() for _ in range(num_secrets)]
+        self.solved = [False] * num_secrets
+
+    def filter(self, guess, feedbacks):
+        """
+        Narrows each secret's candidates by a guess and that secret's feedback.
+
+        Args:
+            guess (str | list | int): The guess, as digits or a packed int.
+            feedbacks (list): One (correct, misplaced) pair per secret, None for solved secrets.
+        """
+        guess_idx = self.space.index(guess)
+        self.history.append((self.space.packed[guess_idx], list(feedbacks)))
+        for k, feedback in enumerate(feedbacks):
+            if feedback is None or self.solved[k]:
+                continue
+            self.candidates[k] = self.backend.filter(self.candidates[k], guess_idx,
+                                                     self.space.encode_feedback(*feedback))
+            self.solved[k] = feedback[0] == self.code_length
+
+    def _unsolved(self):
+        return [c for c, done in zip(self.candidates, self.solved) if not done]
+
+    def joint_scores(self, guess_idxs):
+        """
+        Returns, per guess, the expected fraction of candidates left summed over the unsolved
+        secrets (lower is better). With NumPy backends all sets are scored in one feedback
+        pass over their concatenated candidates.
+        """
+        sets = self._unsolved()
+        if isinstance(sets[0], list):
+            per_set = [self.backend.partition_scores(guess_idxs, c) for c in sets]
+            return [sum(score / len(c) for score, c in zip(scores, sets)) for scores in zip(*per_set)]
+        sizes = np.array([len(c) for c in sets])
+        pool = np.concatenate(sets)
+        owners = np.repeat(np.arange(len(sets)), sizes)
+        num_feedbacks = (self.code_length + 1) ** 2
+        guess_idxs = np.asarray(guess_idxs, dtype=np.intp)
+        scores = np.empty(len(guess_idxs))
+        step = max(1, MATRIX_MAX_CELLS // max(len(pool), 1))
+        for start in range(0, len(guess_idxs), step):
+            matrix = np.asarray(self.backend.feedback_matrix(guess_idxs[start:start + step], pool), dtype=np.intp)
+            keys = (np.arange(len(matrix))[:, None] * len(sets) + owners) * num_feedbacks + matrix
+            counts = np.bincount(keys.ravel(), minlength=len(matrix) * len(sets) * num_feedbacks
+                                 ).reshape(len(matrix), len(sets), num_feedbacks)
+            scores[start:start + step] = ((counts ** 2).sum(axis=2) / sizes).sum(axis=1)
+        return scores
+
+    def _guess_pool(self, pool_size):
+        """An evenly spaced share of pool_size candidates from every unsolved set."""
+        sets = self._unsolved()
+        share = max(1, pool_size // len(sets))
+        pool = {int(i) for c in sets for i in c[::max(1, len(c) // share)]}
+        return sorted(pool)
+
+    def best_guess(self, pool_size=MULTI_GUESS_POOL, time_budget=None, rng=None):
+        """
+        Returns the guess for the next move, or None once every secret is solved.
+
+        A set with one candidate left is cracked right away. Otherwise the opening is the
+        single-secret opening (every set is the whole space; with a time_budget, a cached
+        best_guess() opening or else a sampled one), and later moves compare a pool of
+        candidates drawn from all unsolved sets by joint_scores(). With a time_budget the
+        pool is shuffled and scored in chunks until the budget runs out.
+        """
+        sets = self._unsolved()
+        if not sets or any(len(c) == 0 for c in sets):
+            return None
+        for c in sets:
+            if len(c) == 1:
+                return self.space.codes[c[0]]
+        if not self.history:
+            opening = CodeCrackSolver(self.code_length, self.digits, self.allow_duplicates,
+                                      backend=self.backend.name)
+            if time_budget is None or BEST_GUESS_POOL in self.space._openings:
+                return opening.best_guess()
+            return opening.sampled_guess(time_budget, rng)
+        start = time.perf_counter()
+        pool = self._guess_pool(pool_size)
+        if time_budget is None:
+            scores = list(self.joint_scores(pool))
+            return self.space.codes[pool[scores.index(min(scores))]]
+        (rng or random).shuffle(pool)
+        best, best_score = None, None
+        for first in range(0, len(pool), SAMPLE_GUESSES):
+            chunk = pool[first:first + SAMPLE_GUESSES]
+            scores = list(self.joint_scores(chunk))
+            if best is None or min(scores) < best_score:
+                best_score = min(scores)
+                best = chunk[scores.index(best_score)]
+            if time.perf_counter() - start > time_budget:
+                break
+        return self.space.codes[best]
+
+    def sampled_guess(self, time_budget=MOVE_TIME_BUDGET, rng=None):
+        """Time-budgeted best_guess(), so hints can use either solver."""
+        return self.best_guess(time_budget=time_budget, rng=rng)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="CodeCrack engine utilities.")
+    parser.add_argument("--build-tables", action="store_true",
+                        help=f"build the disk feedback tables of the GUI levels in {table_dir()}")
+    args = parser.parse_args()
+    if args.build_tables:
+        build_tables()
+    else:
+        parser.print_help()
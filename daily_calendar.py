@@ -0,0 +1,124 @@
+"""
+Precomputed daily-puzzle calendar.
+
+build_calendar() works out the level and secret code of every day in a date range, rates
+each secret by how many guesses the engine's solvers need, and writes fixed-size records
+to a binary file. lookup_daily() then reads any day back with a single seek.
+"""
+import os
+import random
+import struct
+from datetime import date, datetime
+from multiprocessing import Pool
+from CodeCrackGame import CodeCrackGame, DIFFICULTY_SETTINGS, daily_seed
+from codecrack_engine import CodeCrackSolver, score
+
+CALENDAR_FILE = "daily_calendar.bin"
+DIGITS = "123456"
+LEVELS = list(DIFFICULTY_SETTINGS)
+
+MAGIC = b"CCAL"
+VERSION = 1
+HEADER = struct.Struct("<4sHxxII")  # magic, version, first day (date ordinal), number of days
+RECORD = struct.Struct("<B8sBB")    # level index, secret (ASCII, NUL padded), best-split, greedy guesses
+
+
+def _to_date(day):
+    if day is None:
+        return datetime.now().date()
+    if isinstance(day, str):
+        return datetime.strptime(day, "%Y-%m-%d").date()
+    if isinstance(day, datetime):
+        return day.date()
+    return day
+
+
+def daily_puzzle(day=None):
+    """
+    Derives a day's puzzle from its date seed, the same way the GUI always has.
+
+    Returns:
+        (str, list): Tuple of (level, secret_code)
+    """
+    day = _to_date(day)
+    level = random.Random(daily_seed(day)).choice(LEVELS)
+    game = CodeCrackGame(**DIFFICULTY_SETTINGS[level])
+    return level, game._generate_daily_code(day)
+
+
+def solver_guess_count(level, secret, strategy="greedy"):
+    """
+    Counts the guesses a solver needs to crack a secret, ignoring the guess limit.
+
+    Args:
+        level (str): A key of DIFFICULTY_SETTINGS.
+        secret (str | list): The secret code.
+        strategy (str): "greedy" plays the first consistent code, "best_split" the consistent
+            code that splits the remaining candidates into the most groups (the best_guess()
+            heuristic, not an optimal solver, so its count is only an upper bound).
+    """
+    settings = DIFFICULTY_SETTINGS[level]
+    solver = CodeCrackSolver(settings["code_length"], DIGITS, settings["allow_duplicates"])
+    pick = solver.best_guess if strategy == "best_split" else solver.next_guess
+    guesses = 0
+    while True:
+        guess = pick()
+        guesses += 1
+        correct, misplaced = score(guess, secret)
+        if correct == len(secret):
+            return guesses
+        solver.filter(guess, correct, misplaced)
+
+
+def _rate_day(ordinal):
+    level, secret = daily_puzzle(date.fromordinal(ordinal))
+    return RECORD.pack(LEVELS.index(level), ''.join(secret).encode("ascii"),
+                       solver_guess_count(level, secret, "best_split"),
+                       solver_guess_count(level, secret, "greedy"))
+
+
+def build_calendar(start=None, days=365, path=CALENDAR_FILE, processes=None):
+    """
+    Rates every day from start (default today) for the given number of days and writes the
+    calendar to path. Days are rated in parallel; processes=1 runs everything in-process.
+    """
+    start = _to_date(start).toordinal()
+    ordinals = range(start, start + days)
+    temp_path = path + ".tmp"
+    with open(temp_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, start, days))
+        if processes == 1:
+            f.writelines(map(_rate_day, ordinals))
+        else:
+            with Pool(processes) as pool:
+                f.writelines(pool.imap(_rate_day, ordinals, chunksize=4))
+    os.replace(temp_path, path)
+
+
+def lookup_daily(day=None, path=CALENDAR_FILE):
+    """
+    Reads one day from the calendar.
+
+    Returns:
+        dict: level, secret_code, best_split_guesses and greedy_guesses, or None when the
+        calendar does not exist or does not cover the day.
+    """
+    if not os.path.exists(path):
+        return None
+    ordinal = _to_date(day).toordinal()
+    with open(path, "rb") as f:
+        magic, version, start, days = HEADER.unpack(f.read(HEADER.size))
+        if magic != MAGIC or version != VERSION or not start <= ordinal < start + days:
+            return None
+        f.seek(HEADER.size + (ordinal - start) * RECORD.size)
+        level, secret, best_split, greedy = RECORD.unpack(f.read(RECORD.size))
+    return {
+        "level": LEVELS[level],
+        "secret_code": list(secret.rstrip(b"\0").decode("ascii")),
+        "best_split_guesses": best_split,
+        "greedy_guesses": greedy,
+    }
+
+
+if __name__ == "__main__":
+    build_calendar()
@@ -1,3 +1,9 @@
+"""
+Random-guess per-guess log (codecrack_data.csv) for the visualizer and log validator.
+
+Every guess is uniformly random, so these games say nothing about how people play; for
+realistic game-level training rows (game_stats.csv schema) use player_simulator.py.
+"""
 import random
 import csv
 from CodeCrackGame import CodeCrackGame
@@ -11,15 +17,11 @@ def generate_game_data(num_games=5000, output_file="codecrack_data.csv"):
             is_valid, _ = game._validate_guess(guess)
             if not is_valid:
                 continue
-            guess_list = list(guess)
-            correct, misplaced = game._get_feedback(guess_list)
-            game.history.append((guess_list, correct, misplaced))
-            game.guesses_remaining -= 1
-            if correct == game.code_length:
-                game.won = True
-                break
+            game.make_guess(guess)
         for guess, c, m in game.history:
-            data.append([guess, c, m, ''.join(game.secret_code), game.won, len(game.history)])
+            # Guesses keep the list repr ("['6', '1', '1', '6']") of the committed codecrack_data.csv
+            data.append([str(list(game.format_code(guess))), c, m, game.format_code(game.secret), game.won,
+                         len(game.history)])
 
     with open(output_file, "w", newline="") as f:
         writer = csv.writer(f)
@@ -1,23 +1,213 @@
+import argparse
+import base64
+import io
+import json
+import os
 import pandas as pd
 import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 
-def visualize_results(file_path="codecrack_data.csv"):
-    df = pd.read_csv(file_path)
+SUMMARY_VERSION = 1
+CHUNK_SIZE = 500_000
 
-    # Win/Loss distribution
-    df['Win'].value_counts().plot(kind='bar', title='Win/Loss Distribution')
-    plt.show()
 
-    # Number of guesses histogram
-    df['NumGuesses'].plot(kind='hist', bins=15, title='Distribution of Guesses Used')
-    plt.xlabel("Number of Guesses")
-    plt.show()
+def _file_signature(file_path):
+    stat = os.stat(file_path)
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
 
-    # Boxplot of guess quality by win/loss
-    df.boxplot(column='Correct', by='Win')
-    plt.title("Correct Digits by Win/Loss")
-    plt.suptitle("")
-    plt.show()
+
+def _add_counts(totals, counts):
+    for key, n in counts.items():
+        totals[str(key)] = totals.get(str(key), 0) + int(n)
+
+
+def _quantile(counts, q):
+    """Linear-interpolated quantile of integer values given as {value: count}."""
+    values = sorted(counts)
+    position = q * (sum(counts.values()) - 1)
+    below, above = int(position), int(position) + (position % 1 > 0)
+    seen, low, high = 0, None, None
+    for value in values:
+        seen += counts[value]
+        if low is None and seen > below:
+            low = value
+        if seen > above:
+            high = value
+            break
+    return low + (high - low) * (position - int(position))
+
+
+def outcome_stats(counts):
+    """Count, mean and five-number summary of integer values given as {value: count}."""
+    counts = {int(k): v for k, v in counts.items()}
+    total = sum(counts.values())
+    return {
+        "count": total,
+        "mean": sum(k * v for k, v in counts.items()) / total,
+        "min": min(counts),
+        "q1": _quantile(counts, 0.25),
+        "median": _quantile(counts, 0.5),
+        "q3": _quantile(counts, 0.75),
+        "max": max(counts),
+    }
+
+
+def summarize_results(file_path="codecrack_data.csv", chunksize=CHUNK_SIZE, use_cache=True):
+    """
+    Aggregates the game log in one chunked pass and caches the result beside it.
+
+    The summary is stored as <file_path>.summary.json together with the file's size and
+    modification time, so a re-run on unchanged data just reads it back. If the cache
+    cannot be written (e.g. a read-only directory), the summary is returned uncached.
+
+    Returns:
+        dict: Row count, win/loss counts, NumGuesses counts, Correct counts and stats per outcome.
+    """
+    cache_path = file_path + ".summary.json"
+    signature = _file_signature(file_path)
+    if use_cache and os.path.exists(cache_path):
+        try:
+            with open(cache_path) as f:
+                cached = json.load(f)
+            if cached.get("version") == SUMMARY_VERSION and cached.get("source") == signature:
+                return cached
+        except (OSError, ValueError):
+            pass  # Unreadable cache, rebuild it
+
+    rows, win_counts, guess_counts, correct_by_outcome = 0, {}, {}, {}
+    for chunk in pd.read_csv(file_path, usecols=["Correct", "Win", "NumGuesses"], chunksize=chunksize):
+        rows += len(chunk)
+        _add_counts(win_counts, chunk["Win"].value_counts())
+        _add_counts(guess_counts, chunk["NumGuesses"].value_counts())
+        for (win, correct), n in chunk.groupby(["Win", "Correct"]).size().items():
+            _add_counts(correct_by_outcome.setdefault(str(win), {}), {correct: n})
+
+    summary = {
+        "version": SUMMARY_VERSION,
+        "source": signature,
+        "rows": rows,
+        "win_counts": win_counts,
+        "guess_counts": guess_counts,
+        "correct_by_outcome": correct_by_outcome,
+        "correct_stats": {win: outcome_stats(counts) for win, counts in correct_by_outcome.items()},
+    }
+    temp_path = cache_path + ".tmp"
+    try:
+        with open(temp_path, "w") as f:
+            json.dump(summary, f, indent=2)
+        os.replace(temp_path, cache_path)
+    except OSError:
+        # Caching is an optimization; the summary itself is complete
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+    return summary
+
+
+def _plot_win_loss(ax, summary):
+    counts = summary["win_counts"]
+    labels = sorted(counts, key=counts.get, reverse=True)
+    ax.bar(labels, [counts[label] for label in labels])
+    ax.set_title("Win/Loss Distribution")
+
+
+def _plot_guesses(ax, summary):
+    counts = {int(k): v for k, v in summary["guess_counts"].items()}
+    values = sorted(counts)
+    ax.bar(values, [counts[v] for v in values], width=0.8)
+    ax.set_title("Distribution of Guesses Used")
+    ax.set_xlabel("Number of Guesses")
+    ax.set_ylabel("Frequency")
+
+
+def _plot_correct_by_outcome(ax, summary):
+    ax.set_title("Correct Digits by Win/Loss")
+    if not summary["correct_stats"]:
+        ax.text(0.5, 0.5, "No games logged", ha="center", va="center", transform=ax.transAxes)
+        return
+    boxes = []
+    for win in sorted(summary["correct_stats"]):
+        stats = summary["correct_stats"][win]
+        iqr = stats["q3"] - stats["q1"]
+        values = [int(v) for v in summary["correct_by_outcome"][win]]
+        whislo = min(v for v in values if v >= stats["q1"] - 1.5 * iqr)
+        whishi = max(v for v in values if v <= stats["q3"] + 1.5 * iqr)
+        fliers = [v for v in values if v < whislo or v > whishi]
+        boxes.append({"label": win, "med": stats["median"], "q1": stats["q1"], "q3": stats["q3"],
+                      "whislo": whislo, "whishi": whishi, "fliers": fliers})
+    ax.bxp(boxes)
+    ax.set_xlabel("Win")
+
+
+PLOTS = {
+    "win_loss": _plot_win_loss,
+    "guesses": _plot_guesses,
+    "correct_by_outcome": _plot_correct_by_outcome,
+}
+
+
+def render_report(summary, output_dir="reports"):
+    """
+    Renders every plot to PNG plus a self-contained report.html, without needing a display.
+
+    Returns:
+        list: Paths of the files written.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    paths, images = [], []
+    for name, plot in PLOTS.items():
+        fig = Figure(figsize=(6, 4))
+        plot(fig.add_subplot(), summary)
+        fig.tight_layout()
+        path = os.path.join(output_dir, f"{name}.png")
+        fig.savefig(path)
+        paths.append(path)
+        buffer = io.BytesIO()
+        fig.savefig(buffer, format="png")
+        images.append(base64.b64encode(buffer.getvalue()).decode("ascii"))
+
+    rows = "".join(
+        f"<tr><td>{win}</td>" + "".join(f"<td>{stats[k]:.2f}</td>" for k in ("mean", "min", "q1", "median", "q3", "max"))
+        + f"<td>{stats['count']}</td></tr>"
+        for win, stats in sorted(summary["correct_stats"].items())
+    )
+    table = (
+        "<h2>Correct digits by outcome</h2><table border='1'>"
+        "<tr><th>Win</th><th>Mean</th><th>Min</th><th>Q1</th><th>Median</th><th>Q3</th><th>Max</th><th>Rows</th></tr>"
+        f"{rows}</table>"
+    ) if rows else ""
+    html = (
+        "<html><head><meta charset='utf-8'><title>CodeCrack Report</title></head><body>"
+        f"<h1>CodeCrack Report</h1><p>{summary['rows']} logged guesses</p>"
+        + table
+        + "".join(f"<p><img src='data:image/png;base64,{image}'></p>" for image in images)
+        + "</body></html>"
+    )
+    path = os.path.join(output_dir, "report.html")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(html)
+    paths.append(path)
+    return paths
+
+
+def visualize_results(file_path="codecrack_data.csv", output_dir=None):
+    """
+    Plots the game log. With output_dir set, writes PNG/HTML files instead of opening windows.
+    """
+    summary = summarize_results(file_path)
+    if output_dir is not None:
+        return render_report(summary, output_dir)
+
+    for plot in PLOTS.values():
+        fig, ax = plt.subplots()
+        plot(ax, summary)
+        plt.show()
 
 if __name__ == "__main__":
-    visualize_results()
+    parser = argparse.ArgumentParser(description="Plot the CodeCrack game log.")
+    parser.add_argument("file_path", nargs="?", default="codecrack_data.csv", help="game log CSV")
+    parser.add_argument("--output-dir", default="reports", help="where PNG/HTML reports are written")
+    parser.add_argument("--show", action="store_true", help="open plot windows instead of writing files")
+    args = parser.parse_args()
+    paths = visualize_results(args.file_path, output_dir=None if args.show else args.output_dir)
+    for path in paths or []:
+        print(path)
@@ -0,0 +1,281 @@
+"""
+Daily-puzzle leaderboard stored in SQLite.
+
+Every player's daily result is ranked by outcome, then guesses used, then time taken;
+the all-time board ranks players by wins, then average guesses, then average time.
+Both orders are reduced to one integer score key (lower is better), so:
+
+    top k     - an index scan over (board, score_key), O(log n + k).
+    my rank   - 1 + the number of entries with a smaller key, read from a Fenwick tree
+                over the key range that is stored sparsely in the rank_tree table and
+                updated in the same transaction as the result, O(KEY_BITS) lookups.
+
+Submissions from many threads or processes are serialized by SQLite (WAL mode,
+BEGIN IMMEDIATE). Use one Leaderboard object per thread.
+"""
+import getpass
+import os
+import random
+import sqlite3
+import tempfile
+import threading
+import time
+from datetime import date, timedelta
+
+LEADERBOARD_DB = "leaderboard.db"
+PLAYER_ENV_VAR = "CODECRACK_PLAYER"
+ALL_TIME = "all-time"  # board name of the all-time ranking; daily boards are "YYYY-MM-DD"
+KEY_BITS = 48  # score keys are below 2 ** KEY_BITS
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS daily_results (
+    day TEXT NOT NULL,
+    player TEXT NOT NULL,
+    result TEXT NOT NULL,
+    guesses_used INTEGER NOT NULL,
+    time_taken REAL NOT NULL,
+    score_key INTEGER NOT NULL,
+    PRIMARY KEY (day, player)
+);
+CREATE INDEX IF NOT EXISTS daily_results_rank ON daily_results (day, score_key);
+CREATE TABLE IF NOT EXISTS players (
+    player TEXT PRIMARY KEY,
+    games INTEGER NOT NULL,
+    wins INTEGER NOT NULL,
+    total_guesses INTEGER NOT NULL,
+    total_time REAL NOT NULL,
+    score_key INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS players_rank ON players (score_key);
+CREATE TABLE IF NOT EXISTS rank_tree (
+    board TEXT NOT NULL,
+    node INTEGER NOT NULL,
+    n INTEGER NOT NULL,
+    PRIMARY KEY (board, node)
+) WITHOUT ROWID;
+"""
+
+
+def default_player():
+    """The name results are submitted under: $CODECRACK_PLAYER, else the OS user name."""
+    return os.environ.get(PLAYER_ENV_VAR) or getpass.getuser()
+
+
+def _board_name(day):
+    """Board name of a day ("YYYY-MM-DD" string or date), or of the all-time board for None."""
+    if day is None:
+        return ALL_TIME
+    return day if isinstance(day, str) else day.strftime("%Y-%m-%d")
+
+
+def daily_score_key(result, guesses_used, time_taken):
+    """Orders daily results: wins first, then fewer guesses, then less time (0.1 s steps)."""
+    deciseconds = min(int(round(time_taken * 10)), 2 ** 24 - 1)
+    return (result != "win") << 31 | min(guesses_used, 127) << 24 | deciseconds
+
+
+def all_time_score_key(games, wins, total_guesses, total_time):
+    """Orders players: more wins first, then fewer guesses per game, then less time per game."""
+    average_guesses = min(int(round(total_guesses * 100 / games)), 2 ** 11 - 1)
+    average_time = min(int(round(total_time * 10 / games)), 2 ** 21 - 1)
+    return (2 ** 16 - 1 - min(wins, 2 ** 16 - 1)) << 32 | average_guesses << 21 | average_time
+
+
+class Leaderboard:
+    """
+    Per-day and all-time rankings of daily-puzzle results.
+    """
+
+    def __init__(self, path=LEADERBOARD_DB, timeout=30.0):
+        """
+        Opens (and if needed creates) the leaderboard database.
+
+        Args:
+            path (str): SQLite database file.
+            timeout (float): Seconds to wait for another writer before giving up.
+        """
+        self.db = sqlite3.connect(path, timeout=timeout, isolation_level=None)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self.db.executescript(SCHEMA)
+
+    def close(self):
+        self.db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _tree_add(self, board, key, delta):
+        """Adds delta to the count of key in the board's Fenwick tree."""
+        nodes = []
+        node = key + 1
+        while node <= 2 ** KEY_BITS:
+            nodes.append((board, node, delta))
+            node += node & -node
+        self.db.executemany("INSERT INTO rank_tree (board, node, n) VALUES (?, ?, ?) "
+                            "ON CONFLICT (board, node) DO UPDATE SET n = n + excluded.n", nodes)
+
+    def _tree_count_below(self, board, key):
+        """Counts the board's entries whose score key is smaller than key."""
+        nodes = []
+        node = key
+        while node > 0:
+            nodes.append(node)
+            node -= node & -node
+        if not nodes:
+            return 0
+        placeholders = ",".join("?" * len(nodes))
+        row = self.db.execute(f"SELECT COALESCE(SUM(n), 0) FROM rank_tree WHERE board = ? AND node IN ({placeholders})",
+                              [board, *nodes]).fetchone()
+        return row[0]
+
+    def submit(self, player, day, result, guesses_used, time_taken):
+        """
+        Records a player's daily result and updates both rankings atomically.
+        Only the first result per player and day counts.
+
+        Args:
+            player (str): Player name.
+            day (str | date): The puzzle's day.
+            result (str): "win" or "loss".
+            guesses_used (int): Guesses the player made.
+            time_taken (float): Seconds the player took.
+
+        Returns:
+            bool: False if the player already had a result for that day.
+        """
+        day = _board_name(day)
+        key = daily_score_key(result, guesses_used, time_taken)
+        self.db.execute("BEGIN IMMEDIATE")
+        try:
+            inserted = self.db.execute(
+                "INSERT INTO daily_results (day, player, result, guesses_used, time_taken, score_key) "
+                "VALUES (?, ?, ?, ?, ?, ?) ON CONFLICT (day, player) DO NOTHING",
+                (day, player, result, guesses_used, time_taken, key)).rowcount
+            if inserted:
+                self._tree_add(day, key, 1)
+                row = self.db.execute("SELECT games, wins, total_guesses, total_time, score_key "
+                                      "FROM players WHERE player = ?", (player,)).fetchone()
+                games, wins, total_guesses, total_time, old_key = row or (0, 0, 0, 0.0, None)
+                games, wins = games + 1, wins + (result == "win")
+                total_guesses, total_time = total_guesses + guesses_used, total_time + time_taken
+                new_key = all_time_score_key(games, wins, total_guesses, total_time)
+                self.db.execute("INSERT OR REPLACE INTO players VALUES (?, ?, ?, ?, ?, ?)",
+                                (player, games, wins, total_guesses, total_time, new_key))
+                if old_key != new_key:
+                    if old_key is not None:
+                        self._tree_add(ALL_TIME, old_key, -1)
+                    self._tree_add(ALL_TIME, new_key, 1)
+            self.db.execute("COMMIT")
+        except BaseException:
+            self.db.execute("ROLLBACK")
+            raise
+        return bool(inserted)
+
+    def top(self, k=10, day=None):
+        """
+        Returns the best k entries of a day's board, or of the all-time board when day is None.
+        Tied entries share a rank.
+
+        Returns:
+            list: Dicts with rank, player and the ranked figures.
+        """
+        if day is None:
+            rows = self.db.execute("SELECT player, games, wins, total_guesses, total_time, score_key "
+                                   "FROM players ORDER BY score_key, player LIMIT ?", (k,)).fetchall()
+            columns = ["player", "games", "wins", "total_guesses", "total_time"]
+        else:
+            rows = self.db.execute("SELECT player, result, guesses_used, time_taken, score_key FROM daily_results "
+                                   "WHERE day = ? ORDER BY score_key, player LIMIT ?", (_board_name(day), k)).fetchall()
+            columns = ["player", "result", "guesses_used", "time_taken"]
+        entries, rank, last_key = [], 0, None
+        for position, row in enumerate(rows, 1):
+            if row[-1] != last_key:
+                rank, last_key = position, row[-1]
+            entries.append({"rank": rank, **dict(zip(columns, row))})
+        return entries
+
+    def rank(self, player, day=None):
+        """
+        Returns a player's rank on a day's board (or the all-time board), or None if absent.
+        """
+        board = _board_name(day)
+        if day is None:
+            row = self.db.execute("SELECT score_key FROM players WHERE player = ?", (player,)).fetchone()
+        else:
+            row = self.db.execute("SELECT score_key FROM daily_results WHERE day = ? AND player = ?",
+                                  (board, player)).fetchone()
+        if row is None:
+            return None
+        return 1 + self._tree_count_below(board, row[0])
+
+    def size(self, day=None):
+        """Returns the number of entries on a day's board, or on the all-time board."""
+        return self._tree_count_below(_board_name(day), 2 ** KEY_BITS)
+
+
+def random_submissions(players, days, seed=0):
+    """Shuffled (player, day, result, guesses_used, time_taken) tuples, one per player and day."""
+    rng = random.Random(seed)
+    first_day = date(2026, 1, 1)
+    submissions = [(f"player{p}", (first_day + timedelta(days=d)).isoformat(),
+                    "win" if rng.random() < 0.7 else "loss", rng.randint(1, 10), round(rng.uniform(10, 600), 1))
+                   for d in range(days) for p in range(players)]
+    rng.shuffle(submissions)
+    return submissions
+
+
+def submit_concurrently(path, submissions, workers):
+    """Submits the results from several threads at once, one Leaderboard per thread."""
+    def worker(batch):
+        with Leaderboard(path) as board:
+            for submission in batch:
+                board.submit(*submission)
+
+    Leaderboard(path).close()  # Create the schema before the writers race
+    threads = [threading.Thread(target=worker, args=(submissions[i::workers],)) for i in range(workers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def benchmark(players=2000, days=5, workers=8, seed=0):
+    """
+    Times concurrent submissions and the rank / top-10 queries on a throwaway database.
+    Correctness is covered by tests/test_leaderboard.py.
+
+    Returns:
+        dict: Submissions per second and mean top-10 / rank query times in milliseconds.
+    """
+    submissions = random_submissions(players, days, seed)
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "leaderboard.db")
+        start = time.perf_counter()
+        submit_concurrently(path, submissions, workers)
+        submit_time = time.perf_counter() - start
+
+        boards = [None] + sorted({day for _, day, *_ in submissions})
+        with Leaderboard(path) as board:
+            start = time.perf_counter()
+            for day in boards:
+                board.top(10, day)
+            top_time = (time.perf_counter() - start) / len(boards)
+            start = time.perf_counter()
+            for player, day, *_ in submissions:
+                board.rank(player, day)
+            rank_time = (time.perf_counter() - start) / len(submissions)
+    return {
+        "submissions_per_second": len(submissions) / submit_time,
+        "top10_ms": 1000 * top_time,
+        "rank_ms": 1000 * rank_time,
+    }
+
+
+if __name__ == "__main__":
+    report = benchmark()
+    print(f"{report['submissions_per_second']:.0f} submissions/s, top 10 in {report['top10_ms']:.2f} ms, "
+          f"rank in {report['rank_ms']:.3f} ms")
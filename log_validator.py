@@ -0,0 +1,225 @@
+"""
+Bulk validation of logged games.
+
+validate_game_log() replays every game in codecrack_data.csv through the feedback engine
+and checks feedback, guess counts and win flags; validate_game_stats() checks the
+game-level rows of game_stats.csv against the difficulty settings. Both read the file in
+chunks, check each chunk with whole-array operations and can split the rows into a
+quarantine file (with an Issues column) and a clean file.
+"""
+import os
+import numpy as np
+import pandas as pd
+from CodeCrackGame import DIFFICULTY_SETTINGS
+from codecrack_engine import score_many
+
+CHUNK_SIZE = 1_000_000
+DIGITS = "123456"
+
+GAME_LOG_ISSUES = ["unparseable", "feedback_mismatch", "guess_count_mismatch", "win_mismatch"]
+GAME_STATS_ISSUES = ["unknown_difficulty", "settings_mismatch", "bad_secret", "guess_count_mismatch", "bad_result"]
+
+
+def _parse_digits(series):
+    """
+    Splits every string into its digits in one pass over the whole column.
+
+    Returns:
+        (ndarray, ndarray, ndarray): All digits concatenated, each row's offset into them and its digit count
+    """
+    values = series.fillna("").astype(str).tolist()
+    lengths = np.fromiter(map(len, values), dtype=np.intp, count=len(values))
+    buf = np.frombuffer("".join(values).encode("ascii", "replace"), dtype=np.uint8)
+    is_digit = (buf >= ord("0")) & (buf <= ord("9"))
+    rows = np.repeat(np.arange(len(values)), lengths)[is_digit]
+    counts = np.bincount(rows, minlength=len(values))
+    return buf[is_digit] - ord("0"), np.cumsum(counts) - counts, counts
+
+
+def _digit_rows(digits, offsets, rows, code_length):
+    """Gathers the digits of the given rows (all code_length long) into an (n, code_length) array."""
+    return digits[offsets[rows][:, None] + np.arange(code_length)]
+
+
+def _labels(flags, names):
+    """Turns per-row issue bit flags into ';'-joined issue names."""
+    labels = np.empty(len(flags), dtype=object)
+    for value in np.unique(flags):
+        labels[flags == value] = ";".join(name for bit, name in enumerate(names) if value >> bit & 1)
+    return labels
+
+
+class _SplitWriter:
+    """Appends checked chunks to the quarantine and clean files, writing headers once."""
+
+    def __init__(self, quarantine_file, clean_file):
+        self.files = {True: quarantine_file, False: clean_file}
+        self.started = set()
+
+    def write(self, df, flags, names):
+        bad = flags != 0
+        for is_bad, path in self.files.items():
+            rows = df[bad] if is_bad else df[~bad]
+            if path is None or (len(rows) == 0 and path in self.started):
+                continue
+            if is_bad:
+                rows = rows.assign(Issues=_labels(flags[bad], names))
+            rows.to_csv(path, mode="a" if path in self.started else "w",
+                        header=path not in self.started, index=False)
+            self.started.add(path)
+
+
+def _report(rows, units, flags, names, totals):
+    totals["rows"] += rows
+    totals[units] += len(flags)
+    totals["invalid_" + units] += int(np.count_nonzero(flags))
+    for bit, name in enumerate(names):
+        totals["issues"][name] += int(np.count_nonzero(flags >> bit & 1))
+
+
+def _check_game_log(df):
+    """Returns per-row issue flags (shared by every row of a game) and per-game flags."""
+    n = len(df)
+    guess_digits, guess_offsets, guess_lengths = _parse_digits(df["Guess"])
+    secret_digits, secret_offsets, code_lengths = _parse_digits(df["SecretCode"])
+    correct = pd.to_numeric(df["Correct"], errors="coerce").to_numpy()
+    misplaced = pd.to_numeric(df["Misplaced"], errors="coerce").to_numpy()
+    num_guesses = pd.to_numeric(df["NumGuesses"], errors="coerce").fillna(0).to_numpy().astype(np.intp)
+    win = df["Win"].astype(str).str.lower().map({"true": 1, "false": 0}).fillna(-1).to_numpy().astype(np.intp)
+
+    parsed = ((guess_lengths == code_lengths) & (code_lengths > 0) & (num_guesses > 0) & (win >= 0)
+              & ~np.isnan(correct) & ~np.isnan(misplaced))
+    feedback_ok = np.zeros(n, dtype=bool)
+    for code_length in np.unique(code_lengths[parsed]):
+        rows = np.flatnonzero(parsed & (code_lengths == code_length))
+        got_correct, got_misplaced = score_many(
+            _digit_rows(guess_digits, guess_offsets, rows, code_length),
+            _digit_rows(secret_digits, secret_offsets, rows, code_length))
+        feedback_ok[rows] = (got_correct == correct[rows]) & (got_misplaced == misplaced[rows])
+
+    # A game is a run of rows with the same SecretCode and NumGuesses, NumGuesses rows long
+    secrets = df["SecretCode"].to_numpy(dtype=object)
+    new_run = np.ones(n, dtype=bool)
+    new_run[1:] = (secrets[1:] != secrets[:-1]) | (num_guesses[1:] != num_guesses[:-1])
+    run_starts = np.flatnonzero(new_run)
+    position = np.arange(n) - run_starts[np.cumsum(new_run) - 1]
+    block = position // np.maximum(num_guesses, 1)
+    new_game = new_run.copy()
+    new_game[1:] |= block[1:] != block[:-1]
+    game_id = np.cumsum(new_game) - 1
+    firsts = np.flatnonzero(new_game)
+    lasts = np.append(firsts[1:] - 1, n - 1)
+
+    def any_row(mask):
+        return np.bincount(game_id, weights=mask) > 0
+
+    solved = parsed & (correct == code_lengths)
+    solved_count = np.bincount(game_id, weights=solved)
+    win_mismatch = ((np.minimum.reduceat(win, firsts) != np.maximum.reduceat(win, firsts))
+                    | (win[firsts] != solved[lasts]) | (solved_count > solved[lasts]))
+    game_flags = (any_row(~parsed).astype(np.intp)
+                  | any_row(parsed & ~feedback_ok) << 1
+                  | (np.bincount(game_id) != num_guesses[firsts]) << 2
+                  | win_mismatch << 3)
+    return game_flags[game_id], game_flags
+
+
+def validate_game_log(file_path="codecrack_data.csv", quarantine_file=None, clean_file=None,
+                      chunksize=CHUNK_SIZE):
+    """
+    Replays every game in a per-guess log (the codecrack_data.csv schema) and checks that
+    each row's feedback matches its SecretCode, that NumGuesses matches the game's row
+    count, and that Win matches the final feedback.
+
+    Returns:
+        dict: Row, game and invalid game counts plus the number of games with each issue.
+    """
+    totals = {"rows": 0, "games": 0, "invalid_games": 0, "issues": dict.fromkeys(GAME_LOG_ISSUES, 0)}
+    writer = _SplitWriter(quarantine_file, clean_file)
+    carry = None
+    reader = pd.read_csv(file_path, dtype={"Guess": str, "SecretCode": str, "Win": str},
+                         keep_default_na=False, chunksize=chunksize)
+    for chunk in reader:
+        df = chunk if carry is None else pd.concat([carry, chunk], ignore_index=True)
+        # The last game may continue in the next chunk, so hold back its run of rows
+        secrets, num_guesses = df["SecretCode"].to_numpy(dtype=object), df["NumGuesses"].to_numpy()
+        same = (secrets == secrets[-1]) & (num_guesses == num_guesses[-1])
+        tail = len(df) - int(np.argmin(same[::-1])) if not same.all() else 0
+        df, carry = df.iloc[:tail], df.iloc[tail:]
+        if len(df):
+            row_flags, game_flags = _check_game_log(df)
+            writer.write(df, row_flags, GAME_LOG_ISSUES)
+            _report(len(df), "games", game_flags, GAME_LOG_ISSUES, totals)
+    if carry is not None and len(carry):
+        row_flags, game_flags = _check_game_log(carry)
+        writer.write(carry, row_flags, GAME_LOG_ISSUES)
+        _report(len(carry), "games", game_flags, GAME_LOG_ISSUES, totals)
+    return totals
+
+
+def _check_game_stats(df):
+    settings = pd.DataFrame(DIFFICULTY_SETTINGS).T
+    expected = settings.reindex(df["difficulty"].to_numpy())
+    code_length = pd.to_numeric(df["code_length"], errors="coerce").to_numpy()
+    guesses_used = pd.to_numeric(df["guesses_used"], errors="coerce").to_numpy()
+    max_guesses = expected["max_guesses"].to_numpy(dtype=float)
+    allow_duplicates = df["allow_duplicates"].str.lower().to_numpy()
+    result = df["result"].str.lower().to_numpy()
+
+    known = expected["code_length"].notna().to_numpy()
+    settings_mismatch = known & ((code_length != expected["code_length"].to_numpy(dtype=float))
+                                 | (allow_duplicates != expected["allow_duplicates"].astype(str).str.lower().to_numpy()))
+
+    secret_digits, secret_offsets, secret_lengths = _parse_digits(df["secret_code"])
+    bad_secret = (secret_lengths != code_length) | (secret_lengths != df["secret_code"].str.len().to_numpy())
+    for length in np.unique(secret_lengths[~bad_secret]):
+        rows = np.flatnonzero(~bad_secret & (secret_lengths == length))
+        codes = _digit_rows(secret_digits, secret_offsets, rows, length)
+        in_range = np.isin(codes, [int(d) for d in DIGITS]).all(axis=1)
+        ordered = np.sort(codes, axis=1)
+        repeats = (ordered[:, 1:] == ordered[:, :-1]).any(axis=1)
+        bad_secret[rows] = ~in_range | (repeats & (allow_duplicates[rows] == "false"))
+
+    bad_result = ~np.isin(result, ["win", "loss"])
+    guess_count_mismatch = (np.isnan(guesses_used) | (guesses_used < 1)
+                            | (known & ((guesses_used > max_guesses)
+                                        | ((result == "loss") & (guesses_used != max_guesses)))))
+    return ((~known).astype(np.intp) | settings_mismatch << 1 | bad_secret << 2
+            | guess_count_mismatch << 3 | bad_result << 4)
+
+
+def validate_game_stats(file_path="game_stats.csv", quarantine_file=None, clean_file=None,
+                        chunksize=CHUNK_SIZE):
+    """
+    Checks game-level rows (the game_stats.csv schema) against DIFFICULTY_SETTINGS: code
+    length and duplicate rule, secret code digits, guess count and result.
+
+    Returns:
+        dict: Row count, invalid row count and the number of rows with each issue.
+    """
+    totals = {"rows": 0, "games": 0, "invalid_games": 0, "issues": dict.fromkeys(GAME_STATS_ISSUES, 0)}
+    writer = _SplitWriter(quarantine_file, clean_file)
+    for chunk in pd.read_csv(file_path, dtype=str, keep_default_na=False, chunksize=chunksize):
+        if "secret_code" not in chunk.columns:
+            raise ValueError(f"{file_path} does not have game-level rows (no secret_code column).")
+        flags = _check_game_stats(chunk)
+        writer.write(chunk, flags, GAME_STATS_ISSUES)
+        _report(len(chunk), "games", flags, GAME_STATS_ISSUES, totals)
+    return totals
+
+
+def validate_logs(game_log="codecrack_data.csv", game_stats="game_stats.csv"):
+    """Validates both logs that exist, quarantining bad rows beside each file."""
+    checks = [(game_log, validate_game_log), (game_stats, validate_game_stats)]
+    for path, validate in checks:
+        if not os.path.exists(path):
+            continue
+        stem = os.path.splitext(path)[0]
+        report = validate(path, quarantine_file=stem + ".quarantine.csv")
+        issues = ", ".join(f"{name}: {count}" for name, count in report["issues"].items() if count)
+        print(f"{path}: {report['invalid_games']}/{report['games']} games invalid"
+              + (f" ({issues})" if issues else ""))
+
+
+if __name__ == "__main__":
+    validate_logs()
@@ -1,22 +1,41 @@
 import random
+from codecrack_engine import unpack_code
+
+HINT_TIME_BUDGET = 0.05  # seconds a solver-backed hint may take
 
 class MLHintModel:
-    def __init__(self, digits, code_length, max_hints=5):
+    def __init__(self, digits, code_length, max_hints=5, solver=None):
         self.digits = digits
         self.code_length = code_length
         self.max_hints = max_hints
         self.hints_used = 0
+        self.solver = solver  # Optional CodeCrackSolver kept in sync with the game
 
     def suggest(self, history):
+        """
+        Suggests a guess string, or returns None when no hints are left.
+
+        history holds CodeCrackGame entries (packed_guess, correct, misplaced) or
+        MultiCodeGame entries (packed_guess, feedbacks).
+        """
         if self.hints_used >= self.max_hints:
             return None  # No hints left
 
+        # With a solver, suggest its time-budgeted best guess
+        if self.solver is not None:
+            suggestion = self.solver.sampled_guess(HINT_TIME_BUDGET)
+            if suggestion:
+                self.hints_used += 1
+                return suggestion
+
         likely_digits = set()
         confirmed_wrong_digits = set()
 
         # Analyze feedback from history
-        for guess, correct, misplaced in history:
-            total_hits = correct + misplaced
+        for guess, *feedback in history:
+            guess = unpack_code(guess, self.digits, self.code_length)
+            feedbacks = [fb for fb in feedback[0] if fb] if len(feedback) == 1 else [feedback]
+            total_hits = sum(correct + misplaced for correct, misplaced in feedbacks)
             if total_hits == 0:
                 confirmed_wrong_digits.update(guess)
             else:
@@ -1,25 +1,43 @@
-from CodeCrackGame import CodeCrackGame
+from CodeCrackGame import CodeCrackGame, DIFFICULTY_SETTINGS
 import time
 import csv
 import os
+import uuid
 
-def play_game():
+GUESS_LOG_FILE = "guess_log.csv"  # per-guess rows; sessionizer.py turns them into game_stats.csv rows
+
+def select_difficulty():
+    levels = list(DIFFICULTY_SETTINGS)
+    print("Select Difficulty Level:")
+    for number, level in enumerate(levels, 1):
+        settings = DIFFICULTY_SETTINGS[level]
+        duplicates = "duplicates allowed" if settings["allow_duplicates"] else "no duplicates"
+        print(f"{number}. {level} ({settings['code_length']} digits, {duplicates})")
+
+    choice = input(f"Enter choice (1-{len(levels)}, Enter for {levels[0]}): ").strip()
+    if choice.isdigit() and 1 <= int(choice) <= len(levels):
+        return levels[int(choice) - 1]
+    return levels[0]
+
+def play_game(level="Easy"):
     print("🎮 Welcome to CodeCrack!")
     print("Try to guess the secret code. You’ll get feedback after each guess.")
     
-    # Initialize game
-    game = CodeCrackGame(code_length=4, max_guesses=10, allow_duplicates=True, digit_range=(1, 6))
+    # Initialize game with a GUI level's rules, so its logged rows map to that difficulty
+    game = CodeCrackGame(**DIFFICULTY_SETTINGS[level])
     print(f"Digits range: {game.digits[0]} to {game.digits[-1]}")
     print(f"You have {game.max_guesses} guesses. Good luck!\n")
     
     start_time = time.time()
+    game_id = uuid.uuid4().hex
 
     # Prepare CSV logging
-    csv_file = "game_stats.csv"
+    csv_file = GUESS_LOG_FILE
     if not os.path.exists(csv_file):
         with open(csv_file, mode='w', newline='') as file:
             writer = csv.writer(file)
-            writer.writerow(["guess", "correct", "misplaced", "time_elapsed", "hints_used", "code_length", "duplicates_allowed"])
+            writer.writerow(["guess", "correct", "misplaced", "time_elapsed", "hints_used", "code_length", "duplicates_allowed",
+                             "game_id", "max_guesses", "secret_code"])
     
     while game.guesses_remaining > 0:
         guess_str = input(f"Enter your guess ({game.code_length} digits): ").strip()
@@ -29,10 +47,7 @@ def play_game():
             print(f"❌ {error}\n")
             continue
         
-        guess = list(guess_str)
-        correct, misplaced = game._get_feedback(guess)
-        game.history.append((guess, correct, misplaced))
-        game.guesses_remaining -= 1
+        correct, misplaced = game.make_guess(guess_str)
 
         # Log attempt to CSV
         with open(csv_file, mode='a', newline='') as file:
@@ -44,18 +59,20 @@ def play_game():
                 round(time.time() - start_time, 2),
                 0,  # hints_used is static here
                 game.code_length,
-                game.allow_duplicates
+                game.allow_duplicates,
+                game_id,
+                game.max_guesses,
+                game.format_code(game.secret)
             ])
 
         print(f"✅ Correct: {correct}, 🔁 Misplaced: {misplaced}, 🕐 Guesses left: {game.guesses_remaining}\n")
 
         if correct == game.code_length:
             print("🎉 Congratulations! You cracked the code!")
-            game.won = True
             break
     
     if not game.won:
         print(f"❌ Game over. The secret code was: {''.join(game.secret_code)}")
 
 if __name__ == "__main__":
-    play_game()
+    play_game(select_difficulty())
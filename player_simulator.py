@@ -0,0 +1,230 @@
+"""
+Vectorized synthetic player population for CodeCrack.
+
+Whole batches of games are simulated at once with NumPy: every turn picks a guess for
+each game according to the player's skill profile, scores all guesses in one call and
+narrows each game's candidate set. Rows are written in the game_stats.csv schema so the
+win and difficulty predictors can be trained on them.
+"""
+import csv
+import numpy as np
+from CodeCrackGame import DIFFICULTY_SETTINGS, STATS_HEADER
+from codecrack_engine import get_code_space, get_backend
+
+DIGITS = "123456"
+MAX_HINTS = 5
+SOLVER_SAMPLES = 8      # consistent codes a "solver" player weighs each turn
+SOLVER_SECRETS = 128    # candidates each of those is scored against
+BATCH_CELLS = 2 ** 25   # caps batch_size * code-space size for the first filtering pass
+
+# strategy:   "random" guesses any valid code, "consistent" a code that fits all feedback
+#             so far, "solver" the consistent code (of a few sampled) splitting the rest best.
+# noise:      chance per turn of a worse guess (a random code for "consistent" players,
+#             a random consistent code for "solver" players).
+# think_time: median seconds per guess on a 4-digit code; scales with code length.
+# hint_rate:  chance per turn of using a hint (which plays a consistent code).
+SKILL_PROFILES = {
+    "random": {"strategy": "random", "noise": 0.0, "think_time": 5.0, "hint_rate": 0.02},
+    "casual": {"strategy": "consistent", "noise": 0.6, "think_time": 10.0, "hint_rate": 0.15},
+    "consistent": {"strategy": "consistent", "noise": 0.05, "think_time": 15.0, "hint_rate": 0.1},
+    "expert": {"strategy": "solver", "noise": 0.15, "think_time": 20.0, "hint_rate": 0.02},
+    "optimal": {"strategy": "solver", "noise": 0.0, "think_time": 2.0, "hint_rate": 0.0},
+}
+
+DEFAULT_PROFILE_WEIGHTS = {"random": 0.1, "casual": 0.3, "consistent": 0.3, "expert": 0.2, "optimal": 0.1}
+
+
+def _group_starts(owner, num_games):
+    """Candidate count and first pair position of every game (owner must be sorted)."""
+    counts = np.bincount(owner, minlength=num_games)
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    return counts, starts
+
+
+def _pick_consistent(owner, codes, num_games, rng):
+    """Picks one remaining candidate uniformly at random for every game."""
+    counts, starts = _group_starts(owner, num_games)
+    offsets = (rng.random(num_games) * counts).astype(np.intp)
+    return codes[np.minimum(starts + offsets, len(codes) - 1)]
+
+
+def _pick_best(backend, owner, codes, num_games, rng, samples=SOLVER_SAMPLES, secrets=SOLVER_SECRETS):
+    """
+    Samples consistent codes per game and keeps the one with the most distinct feedbacks
+    against the game's candidates (all of them, or a random subset of `secrets` codes).
+    """
+    counts, starts = _group_starts(owner, num_games)
+    last = len(codes) - 1
+    offsets = (rng.random((num_games, samples)) * counts[:, None]).astype(np.intp)
+    options = codes[np.minimum(starts[:, None] + offsets, last)]
+    ranks = np.arange(secrets)
+    offsets = np.where(counts[:, None] <= secrets, np.minimum(ranks, counts[:, None] - 1),
+                       (rng.random((num_games, secrets)) * counts[:, None]).astype(np.intp))
+    sampled = codes[np.clip(starts[:, None] + offsets, 0, last)].ravel()
+    rows = np.repeat(np.arange(num_games), secrets)
+
+    num_feedbacks = (backend.space.code_length + 1) ** 2
+    parts = np.zeros((num_games, samples), dtype=np.intp)
+    for s in range(samples):
+        feedback = np.asarray(backend.feedback_pairs(np.repeat(options[:, s], secrets), sampled), dtype=np.intp)
+        present = np.zeros(num_games * num_feedbacks, dtype=bool)
+        present[rows * num_feedbacks + feedback] = True
+        parts[:, s] = present.reshape(num_games, num_feedbacks).sum(axis=1)
+    return options[np.arange(num_games), parts.argmax(axis=1)]
+
+
+def _opening_guess(backend, rng, samples=64):
+    """The first guess of "solver" players: the sampled code with the most distinct feedbacks."""
+    size = len(backend.space)
+    options = rng.choice(size, size=min(samples, size), replace=False)
+    matrix = np.asarray(backend.feedback_matrix(options))
+    parts = [len(np.unique(row)) for row in matrix]
+    return options[int(np.argmax(parts))]
+
+
+def _first_candidates(backend, guesses, feedback, games, chunk):
+    """Builds the (owner, code) pairs consistent with each game's first guess."""
+    owners, codes = [], []
+    for start in range(0, len(games), chunk):
+        matrix = np.asarray(backend.feedback_matrix(guesses[start:start + chunk]))
+        rows, cols = np.nonzero(matrix == feedback[start:start + chunk, None])
+        owners.append(games[start + rows])
+        codes.append(cols)
+    if not owners:
+        return np.empty(0, dtype=np.intp), np.empty(0, dtype=np.intp)
+    return np.concatenate(owners), np.concatenate(codes)
+
+
+def simulate_games(level, profile, num_games, rng=None, backend=None):
+    """
+    Simulates num_games games of one difficulty level played with one skill profile.
+
+    Candidates are tracked as flat, owner-sorted (game, code) pairs so every turn costs
+    time proportional to the codes still in play, not to games * code-space size.
+
+    Args:
+        level (str): A key of DIFFICULTY_SETTINGS.
+        profile (str): A key of SKILL_PROFILES.
+        num_games (int): Games to simulate.
+        rng (np.random.Generator | int | None): Random source or seed.
+        backend (str): Feedback backend name (see codecrack_engine.get_backend).
+
+    Returns:
+        dict: Arrays "secret", "won", "guesses_used", "hints_used" and "time_taken".
+    """
+    settings = DIFFICULTY_SETTINGS[level]
+    params = SKILL_PROFILES[profile]
+    code_length = settings["code_length"]
+    rng = np.random.default_rng(rng)
+    space = get_code_space(DIGITS, code_length, settings["allow_duplicates"])
+    backend = get_backend(space, backend)
+    size = len(space)
+    solved = space.encode_feedback(code_length, 0)
+
+    secrets = rng.integers(size, size=num_games)
+    active = np.ones(num_games, dtype=bool)
+    won = np.zeros(num_games, dtype=bool)
+    guesses_used = np.zeros(num_games, dtype=np.intp)
+    hints_used = np.zeros(num_games, dtype=np.intp)
+    time_taken = np.zeros(num_games)
+    think_median = np.log(params["think_time"] * code_length / 4)
+    opening = _opening_guess(backend, rng) if params["strategy"] == "solver" else None
+    owner = codes = None
+
+    for _ in range(settings["max_guesses"]):
+        games = np.flatnonzero(active)
+        if not len(games):
+            break
+
+        random_codes = rng.integers(size, size=num_games)
+        if owner is None:
+            consistent = random_codes
+            best = np.full(num_games, opening)
+        else:
+            consistent = _pick_consistent(owner, codes, num_games, rng)
+            best = _pick_best(backend, owner, codes, num_games, rng) if opening is not None else None
+
+        noisy = rng.random(num_games) < params["noise"]
+        if params["strategy"] == "random":
+            guesses = random_codes
+        elif params["strategy"] == "consistent":
+            guesses = np.where(noisy, random_codes, consistent)
+        else:
+            guesses = np.where(noisy, consistent, best)
+
+        hinted = active & (hints_used < MAX_HINTS) & (rng.random(num_games) < params["hint_rate"])
+        guesses = np.where(hinted, consistent, guesses)
+        hints_used += hinted
+        time_taken[games] += rng.lognormal(think_median, 0.5, len(games))
+        guesses_used[games] += 1
+
+        feedback = np.full(num_games, -1, dtype=np.intp)
+        feedback[games] = np.asarray(backend.feedback_pairs(guesses[games], secrets[games]))
+        won |= feedback == solved
+        active &= feedback != solved
+
+        if owner is None:
+            chunk = max(1, BATCH_CELLS // (8 * size))
+            still = np.flatnonzero(active)
+            owner, codes = _first_candidates(backend, guesses[still], feedback[still], still, chunk)
+        else:
+            keep = np.flatnonzero(active[owner])
+            owner, codes = owner[keep], codes[keep]
+            matches = np.asarray(backend.feedback_pairs(guesses[owner], codes)) == feedback[owner]
+            owner, codes = owner[matches], codes[matches]
+
+    return {
+        "secret": secrets,
+        "won": won,
+        "guesses_used": guesses_used,
+        "hints_used": hints_used,
+        "time_taken": time_taken,
+    }
+
+
+def simulate_population(num_games, profile_weights=None, level_weights=None, seed=None,
+                        batch_size=2000, backend=None):
+    """
+    Yields lists of game_stats.csv rows for a mixed population of players.
+
+    Each game is assigned a skill profile and a difficulty level at random; games sharing
+    both are simulated together in batches. Rows come out grouped by (level, profile).
+    """
+    profile_weights = profile_weights or DEFAULT_PROFILE_WEIGHTS
+    level_weights = level_weights or {level: 1.0 for level in DIFFICULTY_SETTINGS}
+    rng = np.random.default_rng(seed)
+
+    profiles = list(profile_weights)
+    levels = list(level_weights)
+    profile_p = np.array([profile_weights[p] for p in profiles], dtype=float)
+    level_p = np.array([level_weights[l] for l in levels], dtype=float)
+    profile_ids = rng.choice(len(profiles), size=num_games, p=profile_p / profile_p.sum())
+    level_ids = rng.choice(len(levels), size=num_games, p=level_p / level_p.sum())
+    group_sizes = np.bincount(level_ids * len(profiles) + profile_ids, minlength=len(levels) * len(profiles))
+
+    for group, group_size in enumerate(group_sizes):
+        level, profile = levels[group // len(profiles)], profiles[group % len(profiles)]
+        settings = DIFFICULTY_SETTINGS[level]
+        space = get_code_space(DIGITS, settings["code_length"], settings["allow_duplicates"])
+        batch = max(1, min(batch_size, BATCH_CELLS // len(space)))
+        for start in range(0, int(group_size), batch):
+            result = simulate_games(level, profile, min(batch, int(group_size) - start), rng, backend)
+            yield [
+                [level, "win" if w else "loss", round(float(t), 1), int(g), int(h),
+                 settings["code_length"], settings["allow_duplicates"], space.codes[s]]
+                for s, w, g, h, t in zip(result["secret"], result["won"], result["guesses_used"],
+                                         result["hints_used"], result["time_taken"])
+            ]
+
+
+def generate_player_stats(num_games=100000, output_file="simulated_game_stats.csv", **kwargs):
+    """Simulates num_games games and writes them to output_file in the game_stats.csv schema."""
+    with open(output_file, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(STATS_HEADER)
+        for rows in simulate_population(num_games, **kwargs):
+            writer.writerows(rows)
+
+
+if __name__ == "__main__":
+    generate_player_stats()
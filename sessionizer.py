@@ -0,0 +1,221 @@
+"""
+Incremental ETL from the per-guess log to game-level training rows.
+
+sessionize() reads guess_log.csv (written by play_game_human_with_logging.py) from the
+offset saved in its checkpoint, groups consecutive rows into games and appends one row
+per finished game to game_stats.csv, the store train_win_predictor.py and
+train_difficulty_predictor.py read. Only the rows of the game in progress are held in
+memory, so a run costs time proportional to the new data and constant memory.
+
+The checkpoint records the log offset just past the last finished game. Finished games
+are appended in batches of at most STORE_BATCH_ROWS rows, and each batch is saved in the
+checkpoint (with the store offset it starts at) before it is written. A run interrupted
+while writing is repaired on the next start: a batch found whole in the store is kept, a
+partly written one at the end of the store is cut off and emitted again. Other writers
+may append to the store between runs; if they changed the bytes of an unfinished batch
+nothing is truncated and sessionize() raises ValueError.
+"""
+import csv
+import io
+import json
+import os
+import time
+from CodeCrackGame import DIFFICULTY_SETTINGS, STATS_HEADER
+
+GUESS_LOG_FILE = "guess_log.csv"
+TRAINING_STORE = "game_stats.csv"
+CHECKPOINT_VERSION = 1
+STORE_BATCH_ROWS = 1000  # game rows held in memory before they are appended to the store
+DEFAULT_MAX_GUESSES = 10
+
+
+def _difficulty(code_length, allow_duplicates):
+    """The DIFFICULTY_SETTINGS level played with these rules, or "Custom"."""
+    for level, settings in DIFFICULTY_SETTINGS.items():
+        if settings["code_length"] == code_length and settings["allow_duplicates"] == allow_duplicates:
+            return level
+    return "Custom"
+
+
+def _parse_row(header, line):
+    values = next(csv.reader([line.decode("utf-8")]), None)
+    if not values or len(values) != len(header):
+        return None
+    row = dict(zip(header, values))
+    try:
+        return {
+            "game_id": row.get("game_id"),
+            "guess": row["guess"],
+            "correct": int(row["correct"]),
+            "time_elapsed": float(row["time_elapsed"]),
+            "hints_used": int(row["hints_used"]),
+            "code_length": int(row["code_length"]),
+            "allow_duplicates": row["duplicates_allowed"].strip().lower() == "true",
+            "max_guesses": int(row.get("max_guesses") or 0) or None,
+            "secret_code": row.get("secret_code") or None,
+        }
+    except (KeyError, ValueError):
+        return None
+
+
+def _same_game(game, row):
+    """Whether row continues game (by game_id when logged, else by rules and a rising clock)."""
+    first, last = game[0], game[-1]
+    if row["game_id"] or first["game_id"]:
+        return row["game_id"] == first["game_id"]
+    return ((row["code_length"], row["allow_duplicates"]) == (first["code_length"], first["allow_duplicates"])
+            and row["time_elapsed"] >= last["time_elapsed"])
+
+
+def _max_guesses(game):
+    first = game[0]
+    if first["max_guesses"]:
+        return first["max_guesses"]
+    level = DIFFICULTY_SETTINGS.get(_difficulty(first["code_length"], first["allow_duplicates"]))
+    return level["max_guesses"] if level else DEFAULT_MAX_GUESSES
+
+
+def _is_finished(game):
+    return game[-1]["correct"] == game[0]["code_length"] or len(game) >= _max_guesses(game)
+
+
+def _game_row(game):
+    """Builds the game_stats.csv row of a finished game."""
+    first, last = game[0], game[-1]
+    won = last["correct"] == first["code_length"]
+    secret = first["secret_code"] or (last["guess"] if won else "")
+    return [_difficulty(first["code_length"], first["allow_duplicates"]), "win" if won else "loss",
+            round(last["time_elapsed"], 1), len(game), max(row["hints_used"] for row in game),
+            first["code_length"], first["allow_duplicates"], secret]
+
+
+def _load_checkpoint(path):
+    try:
+        with open(path) as f:
+            checkpoint = json.load(f)
+        if checkpoint.get("version") == CHECKPOINT_VERSION:
+            return checkpoint
+    except (OSError, ValueError):
+        pass  # No or unreadable checkpoint, start from the beginning
+    return {"version": CHECKPOINT_VERSION, "offset": 0, "header": None, "pending": None}
+
+
+def _save_checkpoint(path, checkpoint):
+    temp_path = path + ".tmp"
+    with open(temp_path, "w") as f:
+        json.dump(checkpoint, f)
+    os.replace(temp_path, path)
+
+
+def _recover_batch(store_file, checkpoint):
+    """
+    Settles the batch an interrupted run was writing: kept if it is whole in the store,
+    truncated away if only its beginning made it to the end of the store.
+    """
+    pending = checkpoint.get("pending")
+    if pending and os.path.exists(store_file):
+        rows = pending["rows"].encode("utf-8")
+        with open(store_file, "r+b") as f:
+            f.seek(pending["start"])
+            written = f.read(len(rows))
+            if written == rows:
+                checkpoint["offset"] = pending["offset"]
+            elif rows.startswith(written) and not f.read(1):
+                f.truncate(pending["start"])  # Only bytes of our own unfinished batch
+            else:
+                raise ValueError(f"{store_file} was changed by another writer while a batch was being "
+                                 f"written at byte {pending['start']}; check it and delete the checkpoint.")
+    checkpoint["pending"] = None
+
+
+def _append_batch(store_file, checkpoint, checkpoint_file, rows, offset):
+    """Appends rows (CSV text) to the store, saving them in the checkpoint first."""
+    if rows:
+        with open(store_file, "ab") as store:
+            checkpoint["pending"] = {"start": store.seek(0, os.SEEK_END), "rows": rows, "offset": offset}
+            _save_checkpoint(checkpoint_file, checkpoint)
+            store.write(rows.encode("utf-8"))
+    checkpoint.update(offset=offset, pending=None)
+    _save_checkpoint(checkpoint_file, checkpoint)
+
+
+def sessionize(log_file=GUESS_LOG_FILE, store_file=TRAINING_STORE, checkpoint_file=None,
+               follow=False, poll_interval=1.0):
+    """
+    Turns the per-guess rows added to log_file since the last run into game-level rows.
+
+    Args:
+        log_file (str): Per-guess log to read.
+        store_file (str): Game-level CSV to append to (created with a header if missing).
+        checkpoint_file (str): Where the offset is kept; defaults to <log_file>.checkpoint.json.
+        follow (bool): Keep tailing the log, polling every poll_interval seconds, until interrupted.
+
+    Returns:
+        dict: Counts of rows read, games emitted, unfinished games dropped and unparseable rows.
+    """
+    checkpoint_file = checkpoint_file or log_file + ".checkpoint.json"
+    checkpoint = _load_checkpoint(checkpoint_file)
+    stats = {"rows": 0, "games": 0, "abandoned_games": 0, "bad_rows": 0}
+    if not os.path.exists(log_file):
+        return stats
+    _recover_batch(store_file, checkpoint)
+    if os.path.getsize(log_file) < checkpoint["offset"]:
+        checkpoint.update(offset=0, header=None)  # The log was truncated or replaced
+
+    batch = io.StringIO()
+    writer = csv.writer(batch)
+    if not os.path.exists(store_file) or os.path.getsize(store_file) == 0:
+        writer.writerow(STATS_HEADER)
+    batch_rows = 0
+    game, game_start = [], checkpoint["offset"]
+    with open(log_file, "rb") as log:
+        log.seek(checkpoint["offset"])
+        offset = checkpoint["offset"]
+        try:
+            while True:
+                line = log.readline()
+                if not line.endswith(b"\n"):  # End of file, or a row still being written
+                    if line:
+                        log.seek(offset)
+                    _append_batch(store_file, checkpoint, checkpoint_file, batch.getvalue(),
+                                  game_start if game else offset)
+                    batch.seek(0)
+                    batch.truncate()
+                    batch_rows = 0
+                    if not follow:
+                        break
+                    time.sleep(poll_interval)
+                    continue
+                offset += len(line)
+                if checkpoint["header"] is None:
+                    checkpoint["header"] = next(csv.reader([line.decode("utf-8")]))
+                    game_start = offset
+                    continue
+                row = _parse_row(checkpoint["header"], line)
+                if row is None:
+                    stats["bad_rows"] += 1
+                    continue
+                stats["rows"] += 1
+                if game and not _same_game(game, row):
+                    stats["abandoned_games"] += 1
+                    game = []
+                if not game:
+                    game_start = offset - len(line)
+                game.append(row)
+                if _is_finished(game):
+                    writer.writerow(_game_row(game))
+                    stats["games"] += 1
+                    batch_rows += 1
+                    game, game_start = [], offset
+                    if batch_rows >= STORE_BATCH_ROWS:
+                        _append_batch(store_file, checkpoint, checkpoint_file, batch.getvalue(), offset)
+                        batch.seek(0)
+                        batch.truncate()
+                        batch_rows = 0
+        except KeyboardInterrupt:
+            pass  # Stop following; rows not yet appended are emitted again by the next run
+    return stats
+
+
+if __name__ == "__main__":
+    print(sessionize())
@@ -0,0 +1,18 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import codecrack_engine  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def table_dir(tmp_path, monkeypatch):
+    """Keeps disk feedback tables out of ~/.cache and gives every test fresh code spaces."""
+    monkeypatch.setenv(codecrack_engine.TABLE_DIR_ENV_VAR, str(tmp_path))
+    monkeypatch.delenv(codecrack_engine.BACKEND_ENV_VAR, raising=False)
+    codecrack_engine._cached_code_space.cache_clear()
+    yield tmp_path
+    codecrack_engine._cached_code_space.cache_clear()
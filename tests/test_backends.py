@@ -0,0 +1,141 @@
+"""Differential tests: every feedback backend must agree with score() and with each other."""
+import random
+
+import pytest
+
+import codecrack_engine
+from codecrack_engine import (FEEDBACK_BACKENDS, SWAR_MAX_CODE_LENGTH, TABLE_MAX_CODES, CodeCrackSolver,
+                              MappedTableBackend, MultiCodeSolver, default_backend_name, get_backend,
+                              get_code_space, packed_score, score)
+
+CONFIGS = [("123456", 4, False), ("123456", 4, True), ("123456", 5, True), ("1234", 3, True)]
+SAMPLES = 200
+
+
+def backend_names(space):
+    return [name for name, cls in FEEDBACK_BACKENDS.items()
+            if cls.available() and (name != "table" or len(space) <= TABLE_MAX_CODES)
+            and (name != "packed" or space.code_length <= SWAR_MAX_CODE_LENGTH)]
+
+
+def make_backend(space, name):
+    if name == "mmap-tiled":
+        backend = MappedTableBackend(space, full_max_codes=0, block_rows=100)
+        backend.build_blocks()
+        return backend
+    if name == "mmap-unbuilt":
+        return MappedTableBackend(space, full_max_codes=0, block_rows=100)
+    return get_backend(space, name)
+
+
+def all_backends(space):
+    names = backend_names(space)
+    if MappedTableBackend.available():
+        names += ["mmap-tiled", "mmap-unbuilt"]
+    return names
+
+
+def sample_pairs(space, rng):
+    guesses = [rng.randrange(len(space)) for _ in range(SAMPLES)]
+    secrets = [rng.randrange(len(space)) for _ in range(SAMPLES)]
+    return guesses, secrets
+
+
+@pytest.fixture(params=CONFIGS, ids=lambda c: f"{c[0]}-{c[1]}-{'dup' if c[2] else 'nodup'}")
+def space(request):
+    return get_code_space(*request.param)
+
+
+def test_packed_score_matches_score(space):
+    guesses, secrets = sample_pairs(space, random.Random(0))
+    for g, s in zip(guesses, secrets):
+        assert packed_score(space.packed[g], space.packed[s], space.code_length) == score(space.codes[g], space.codes[s])
+
+
+def test_feedback_matches_score(space):
+    rng = random.Random(1)
+    guesses, secrets = sample_pairs(space, rng)
+    pairs = [score(space.codes[g], space.codes[s]) for g, s in zip(guesses, secrets)]
+    rows = {g: [score(space.codes[g], code) for code in space.codes]
+            for g in rng.sample(range(len(space)), min(SAMPLES // 10, len(space)))}
+    for name in all_backends(space):
+        backend = make_backend(space, name)
+        for guess_idx, expected in rows.items():
+            assert [space.decode_feedback(fb) for fb in backend.feedback_many(guess_idx)] == expected, name
+        assert [space.decode_feedback(fb) for fb in backend.feedback_pairs(guesses, secrets)] == pairs, name
+
+
+def test_partitions_match_python(space):
+    rng = random.Random(2)
+    pool = rng.sample(range(len(space)), min(20, len(space)))
+    secrets = [rng.randrange(len(space)) for _ in range(SAMPLES)]
+    reference = get_backend(space, "python")
+    for name in all_backends(space):
+        backend = make_backend(space, name)
+        for method in ("partition_counts", "partition_scores"):
+            got = [int(v) for v in getattr(backend, method)(pool, secrets)]
+            assert got == getattr(reference, method)(pool, secrets), f"{name} {method}"
+
+
+def test_solver_games_identical(space):
+    rng = random.Random(3)
+    for secret in rng.sample(space.codes, min(SAMPLES // 4, len(space))):
+        transcripts = []
+        for name in backend_names(space):
+            solver = CodeCrackSolver(space.code_length, space.digits, space.allow_duplicates, backend=name)
+            moves = []
+            while True:
+                guess = solver.next_guess()
+                correct, misplaced = score(guess, secret)
+                moves.append((guess, correct, misplaced))
+                if correct == space.code_length:
+                    break
+                solver.filter(guess, correct, misplaced)
+            transcripts.append(moves)
+        assert all(t == transcripts[0] for t in transcripts), secret
+
+
+def test_multi_code_joint_scores_agree(space):
+    rng = random.Random(4)
+    secrets = rng.sample(space.codes, 3)
+    pool = rng.sample(range(len(space)), min(20, len(space)))
+    guess = space.codes[pool[0]]
+    joint = {}
+    for name in backend_names(space):
+        solver = MultiCodeSolver(len(secrets), space.code_length, space.digits, space.allow_duplicates, backend=name)
+        solver.filter(guess, [score(guess, secret) for secret in secrets])
+        joint[name] = [round(float(v), 9) for v in solver.joint_scores(pool)]
+    assert all(scores == joint["python"] for scores in joint.values()), joint
+
+
+def test_mmap_tables_live_in_table_dir(table_dir):
+    if not MappedTableBackend.available():
+        pytest.skip("NumPy is not installed")
+    space = get_code_space("123456", 4, False)
+    get_backend(space, "mmap")
+    assert any(path.name.endswith(".npy") for path in table_dir.iterdir())
+
+
+def test_scoring_never_builds_tiles(table_dir):
+    if not MappedTableBackend.available():
+        pytest.skip("NumPy is not installed")
+    space = get_code_space("123456", 5, True)
+    backend = MappedTableBackend(space, full_max_codes=0, block_rows=1000)
+    reference = get_backend(space, "numpy")
+    pool = list(range(0, len(space), 97))
+    backend.partition_scores(pool)
+    assert not list(table_dir.iterdir())
+    backend._load(backend._block_path(0), 0, 1000)  # Only the first block is built
+    secrets = list(range(len(pool)))
+    assert list(backend.feedback_pairs(pool, secrets)) == list(reference.feedback_pairs(pool, secrets))
+    assert len(list(table_dir.iterdir())) == 1
+
+
+def test_default_backend_maps_built_tables(table_dir, monkeypatch):
+    if not MappedTableBackend.available():
+        pytest.skip("NumPy is not installed")
+    monkeypatch.setattr(codecrack_engine, "MMAP_FULL_MAX_CODES", TABLE_MAX_CODES)
+    space = get_code_space("1234567", 4, True)  # 2401 codes, tiled under the patched limit
+    assert default_backend_name(space) == "numpy"
+    MappedTableBackend(space, full_max_codes=0).build_blocks()
+    assert default_backend_name(space) == "mmap"
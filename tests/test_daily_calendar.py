@@ -0,0 +1,21 @@
+"""The precomputed daily calendar agrees with the date-seeded puzzles."""
+from datetime import date, timedelta
+
+from daily_calendar import build_calendar, daily_puzzle, lookup_daily
+
+START = date(2026, 3, 1)
+DAYS = 3
+
+
+def test_calendar_matches_daily_puzzle(tmp_path):
+    path = str(tmp_path / "calendar.bin")
+    assert lookup_daily(START, path) is None  # No calendar yet
+    build_calendar(START, DAYS, path, processes=1)
+    for offset in range(DAYS):
+        day = START + timedelta(days=offset)
+        entry = lookup_daily(day, path)
+        assert (entry["level"], entry["secret_code"]) == daily_puzzle(day)
+        assert 1 <= entry["best_split_guesses"] and 1 <= entry["greedy_guesses"]
+        assert lookup_daily(day.isoformat(), path) == entry
+    assert lookup_daily(START - timedelta(days=1), path) is None
+    assert lookup_daily(START + timedelta(days=DAYS), path) is None
@@ -0,0 +1,27 @@
+"""CodeCrackGame and MultiCodeGame rules."""
+import pytest
+
+from CodeCrackGame import CodeCrackGame, MultiCodeGame
+from ml_hint_model import MLHintModel
+
+
+@pytest.mark.parametrize("dtype", ["uint64", "int64"])
+def test_make_guess_accepts_numpy_packed_codes(dtype):
+    np = pytest.importorskip("numpy")
+    game = CodeCrackGame(code_length=4, allow_duplicates=True)
+    game.secret_code = "1234"
+    packed = game.pack("1243")
+    assert game.make_guess(np.dtype(dtype).type(packed)) == game._get_feedback(packed) == (2, 2)
+    assert type(game.history[0][0]) is int
+    assert game.to_bytes() == CodeCrackGame.from_bytes(game.to_bytes()).to_bytes()
+
+
+def test_multi_code_game_history_and_hint_fallback():
+    game = MultiCodeGame(num_secrets=3, code_length=4, allow_duplicates=False)
+    assert not isinstance(game, CodeCrackGame) and not hasattr(game, "secret_code")
+    feedbacks = game.make_guess(game.secrets[1])
+    assert feedbacks[1] == (4, 0) and game.solved == [False, True, False]
+    assert game.make_guess(game.format_code(game.secrets[0]))[1] is None
+    assert [guess for guess, _ in game.history] == [game.secrets[1], game.secrets[0]]
+    hint = MLHintModel(game.digits, game.code_length).suggest(game.history)
+    assert len(hint) == game.code_length and set(hint) <= set(game.digits)
@@ -0,0 +1,60 @@
+"""Leaderboard rankings under concurrent submissions, checked against a plain sort."""
+import bisect
+
+import pytest
+
+from leaderboard import (ALL_TIME, Leaderboard, all_time_score_key, daily_score_key, random_submissions,
+                         submit_concurrently)
+
+PLAYERS = 200
+DAYS = 3
+WORKERS = 4
+
+
+@pytest.fixture(scope="module")
+def loaded(tmp_path_factory):
+    path = str(tmp_path_factory.mktemp("leaderboard") / "leaderboard.db")
+    submissions = random_submissions(PLAYERS, DAYS)
+    submit_concurrently(path, submissions, WORKERS)
+    return path, submissions
+
+
+def expected_keys(submissions):
+    """Score keys per board name, computed without the database."""
+    totals = {}
+    for player, _, result, guesses, seconds in submissions:
+        games, wins, total_guesses, total_time = totals.get(player, (0, 0, 0, 0.0))
+        totals[player] = (games + 1, wins + (result == "win"), total_guesses + guesses, total_time + seconds)
+    boards = {ALL_TIME: {player: all_time_score_key(*t) for player, t in totals.items()}}
+    for player, day, result, guesses, seconds in submissions:
+        boards.setdefault(day, {})[player] = daily_score_key(result, guesses, seconds)
+    return boards
+
+
+def test_ranks_match_sort(loaded):
+    path, submissions = loaded
+    with Leaderboard(path) as board:
+        for name, keys in expected_keys(submissions).items():
+            day = None if name == ALL_TIME else name
+            ordered = sorted(keys.values())
+            assert board.size(day) == len(keys), name
+            for player, key in keys.items():
+                assert board.rank(player, day) == 1 + bisect.bisect_left(ordered, key), (name, player)
+
+
+def test_top_matches_sort(loaded):
+    path, submissions = loaded
+    with Leaderboard(path) as board:
+        for name, keys in expected_keys(submissions).items():
+            day = None if name == ALL_TIME else name
+            best = board.top(10, day)
+            assert [e["player"] for e in best] == sorted(keys, key=lambda p: (keys[p], p))[:10], name
+            assert all(board.rank(e["player"], day) == e["rank"] for e in best), name
+
+
+def test_only_first_result_per_day_counts(tmp_path):
+    with Leaderboard(str(tmp_path / "leaderboard.db")) as board:
+        assert board.submit("ada", "2026-01-01", "win", 4, 60.0)
+        assert not board.submit("ada", "2026-01-01", "win", 1, 5.0)
+        assert board.top(1, "2026-01-01")[0]["guesses_used"] == 4
+        assert board.size() == 1 and board.top(1)[0]["games"] == 1
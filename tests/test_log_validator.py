@@ -0,0 +1,97 @@
+"""Log validation: corrupted games are caught and quarantined whatever the chunk size."""
+import csv
+
+import pytest
+
+from codecrack_engine import score
+from log_validator import validate_game_log, validate_game_stats
+
+LOG_HEADER = ["Guess", "Correct", "Misplaced", "SecretCode", "Win", "NumGuesses"]
+CHUNK_SIZES = [1, 2, 3, 7, 50, 1_000_000]
+
+
+def game_rows(secret, guesses, win=None):
+    """Rows of one logged game, scored honestly; win defaults to whether the last guess cracks it."""
+    if win is None:
+        win = guesses[-1] == secret
+    return [[guess, *score(guess, secret), secret, win, len(guesses)] for guess in guesses]
+
+
+def corrupt_log():
+    """Five games; the second, third and fourth are each corrupted one way."""
+    good = game_rows("1234", ["5612", "1243", "1234"])
+    bad_feedback = game_rows("2345", ["1111", "2354", "2345"])
+    bad_feedback[1][1] += 1
+    truncated = game_rows("3456", ["1111", "2222", "3333", "4444"])[:3]  # a lost game missing its last row
+    flipped = game_rows("4561", ["1111", "4516"], win=True)
+    loss = game_rows("6543", ["1111", "2222"])
+    games = {"good": good, "bad_feedback": bad_feedback, "truncated": truncated, "flipped": flipped, "loss": loss}
+    # Guesses are logged as list reprs, as in codecrack_data.csv
+    for rows in games.values():
+        for row in rows:
+            row[0] = str(list(row[0]))
+    return games
+
+
+def write_csv(path, header, rows):
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        writer.writerows(rows)
+    return str(path)
+
+
+def read_csv(path):
+    with open(path, newline="") as f:
+        return list(csv.DictReader(f))
+
+
+@pytest.mark.parametrize("chunksize", CHUNK_SIZES)
+def test_game_log_corruptions(tmp_path, chunksize):
+    games = corrupt_log()
+    log = write_csv(tmp_path / "log.csv", LOG_HEADER, [row for rows in games.values() for row in rows])
+    quarantine, clean = tmp_path / "quarantine.csv", tmp_path / "clean.csv"
+    report = validate_game_log(log, str(quarantine), str(clean), chunksize=chunksize)
+
+    assert report["rows"] == sum(len(rows) for rows in games.values())
+    assert report["games"] == 5 and report["invalid_games"] == 3
+    assert report["issues"] == {"unparseable": 0, "feedback_mismatch": 1, "guess_count_mismatch": 1,
+                                "win_mismatch": 1}
+    bad = read_csv(quarantine)
+    assert [row["SecretCode"] for row in bad] == ["2345"] * 3 + ["3456"] * 3 + ["4561"] * 2
+    assert [row["Issues"] for row in bad] == (["feedback_mismatch"] * 3 + ["guess_count_mismatch"] * 3
+                                              + ["win_mismatch"] * 2)
+    assert [row["SecretCode"] for row in read_csv(clean)] == ["1234"] * 3 + ["6543"] * 2
+
+
+STATS_HEADER_ROW = ["difficulty", "result", "time_taken", "guesses_used", "hints_used",
+                    "code_length", "allow_duplicates", "secret_code"]
+STATS_ROWS = {
+    "valid win": ["Easy", "win", 30.0, 4, 0, 4, False, "1234", ""],
+    "valid loss": ["Hard", "loss", 90.0, 10, 2, 6, True, "112233", ""],
+    "unknown level": ["Custom", "win", 30.0, 4, 0, 4, True, "1123", "unknown_difficulty"],
+    "wrong length": ["Medium", "win", 30.0, 4, 0, 4, True, "1234", "settings_mismatch"],
+    "repeated digit": ["Easy", "win", 30.0, 4, 0, 4, False, "1123", "bad_secret"],
+    "digit out of range": ["Easy", "win", 30.0, 4, 0, 4, False, "1237", "bad_secret"],
+    "short loss": ["Easy", "loss", 30.0, 7, 0, 4, False, "1234", "guess_count_mismatch"],
+    "bad result": ["Easy", "draw", 30.0, 4, 0, 4, False, "1234", "bad_result"],
+}
+
+
+@pytest.mark.parametrize("chunksize", [1, 3, 1_000_000])
+def test_game_stats_issues(tmp_path, chunksize):
+    stats = write_csv(tmp_path / "stats.csv", STATS_HEADER_ROW, [row[:-1] for row in STATS_ROWS.values()])
+    quarantine = tmp_path / "quarantine.csv"
+    report = validate_game_stats(stats, str(quarantine), chunksize=chunksize)
+
+    expected = [row[-1] for row in STATS_ROWS.values() if row[-1]]
+    assert report["games"] == len(STATS_ROWS) and report["invalid_games"] == len(expected)
+    assert [row["Issues"] for row in read_csv(quarantine)] == expected
+    assert report["issues"] == {"unknown_difficulty": 1, "settings_mismatch": 1, "bad_secret": 2,
+                                "guess_count_mismatch": 1, "bad_result": 1}
+
+
+def test_game_stats_rejects_per_guess_logs(tmp_path):
+    log = write_csv(tmp_path / "log.csv", LOG_HEADER, game_rows("1234", ["1234"]))
+    with pytest.raises(ValueError):
+        validate_game_stats(log)
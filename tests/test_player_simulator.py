@@ -0,0 +1,40 @@
+"""Synthetic players: rows in the game_stats.csv schema, and skill that shows in the results."""
+import csv
+
+import pytest
+
+pytest.importorskip("numpy")
+from CodeCrackGame import DIFFICULTY_SETTINGS, STATS_HEADER  # noqa: E402
+from log_validator import validate_game_stats  # noqa: E402
+from player_simulator import generate_player_stats, simulate_population  # noqa: E402
+
+
+def simulated_rows(num_games, **kwargs):
+    return [row for rows in simulate_population(num_games, seed=0, **kwargs) for row in rows]
+
+
+def test_rows_follow_stats_schema(tmp_path):
+    path = str(tmp_path / "simulated.csv")
+    generate_player_stats(300, output_file=path, seed=0)
+    with open(path, newline="") as f:
+        rows = list(csv.reader(f))
+    assert rows[0] == STATS_HEADER
+    assert len(rows) == 301 and all(len(row) == len(STATS_HEADER) for row in rows)
+    assert validate_game_stats(path)["invalid_games"] == 0
+
+
+def test_losses_use_every_guess():
+    rows = simulated_rows(600, profile_weights={"random": 1.0})
+    losses = [row for row in rows if row[1] == "loss"]
+    assert losses
+    for level, _, _, guesses_used, *_ in losses:
+        assert guesses_used == DIFFICULTY_SETTINGS[level]["max_guesses"]
+
+
+def test_optimal_players_beat_random_players():
+    def win_rate(profile):
+        rows = simulated_rows(400, profile_weights={profile: 1.0}, level_weights={"Medium": 1.0})
+        return sum(row[1] == "win" for row in rows) / len(rows)
+
+    optimal, random_rate = win_rate("optimal"), win_rate("random")
+    assert optimal > 0.9 and optimal > random_rate + 0.5, (optimal, random_rate)
@@ -0,0 +1,132 @@
+"""Sessionizer checkpoints: no game is lost or emitted twice, and other writers' rows are kept."""
+import csv
+import json
+
+import pytest
+
+import play_game_human_with_logging
+import sessionizer
+from log_validator import validate_game_stats
+from sessionizer import sessionize
+
+LOG_HEADER = ["guess", "correct", "misplaced", "time_elapsed", "hints_used", "code_length", "duplicates_allowed",
+              "game_id", "max_guesses", "secret_code"]
+
+
+def log_games(path, first, count):
+    """Appends count won two-guess Easy games to a guess log."""
+    new = not path.exists()
+    with open(path, "a", newline="") as f:
+        writer = csv.writer(f)
+        if new:
+            writer.writerow(LOG_HEADER)
+        for game in range(first, first + count):
+            writer.writerow(["1243", 2, 2, 5.0, 0, 4, False, f"g{game}", 10, "1234"])
+            writer.writerow(["1234", 4, 0, 9.0, 1, 4, False, f"g{game}", 10, "1234"])
+
+
+def store_rows(path):
+    with open(path, newline="") as f:
+        return list(csv.reader(f))
+
+
+@pytest.fixture
+def files(tmp_path):
+    return tmp_path / "guess_log.csv", tmp_path / "game_stats.csv", tmp_path / "checkpoint.json"
+
+
+def run(files):
+    log, store, checkpoint = files
+    return sessionize(str(log), str(store), str(checkpoint))
+
+
+def test_incremental_runs_emit_each_game_once(files):
+    log, store, _ = files
+    log_games(log, 0, 3)
+    assert run(files)["games"] == 3
+    assert run(files)["games"] == 0
+    log_games(log, 3, 2)
+    assert run(files)["games"] == 2
+    assert len(store_rows(store)) == 1 + 5
+
+
+def test_rows_appended_by_others_are_kept(files):
+    log, store, _ = files
+    log_games(log, 0, 2)
+    run(files)
+    with open(store, "a", newline="") as f:
+        csv.writer(f).writerow(["Easy", "win", 1.0, 1, 0, 4, False, "4321"])
+    log_games(log, 2, 1)
+    run(files)
+    rows = store_rows(store)
+    assert len(rows) == 1 + 4 and rows[3][-1] == "4321"
+
+
+class Crash(Exception):
+    pass
+
+
+def crash_while_writing(files, monkeypatch, written_bytes):
+    """Runs sessionize until it has written written_bytes of its first batch, then stops."""
+    real_write = sessionizer._append_batch
+
+    def append_and_crash(store_file, checkpoint, checkpoint_file, rows, offset):
+        if rows:
+            with open(store_file, "ab") as f:
+                checkpoint["pending"] = {"start": f.seek(0, 2), "rows": rows, "offset": offset}
+                sessionizer._save_checkpoint(checkpoint_file, checkpoint)
+                f.write(rows.encode("utf-8")[:written_bytes])
+            raise Crash
+        real_write(store_file, checkpoint, checkpoint_file, rows, offset)
+
+    monkeypatch.setattr(sessionizer, "_append_batch", append_and_crash)
+    with pytest.raises(Crash):
+        run(files)
+    monkeypatch.setattr(sessionizer, "_append_batch", real_write)
+
+
+@pytest.mark.parametrize("written_bytes", [0, 10, None])
+def test_interrupted_batch_is_recovered(files, monkeypatch, written_bytes):
+    log, store, _ = files
+    log_games(log, 0, 2)
+    run(files)
+    log_games(log, 2, 3)
+    crash_while_writing(files, monkeypatch, written_bytes)
+    run(files)
+    assert [row[-1] for row in store_rows(store)[1:]] == ["1234"] * 5
+
+
+def test_foreign_bytes_in_unfinished_batch_are_not_truncated(files, monkeypatch):
+    log, store, checkpoint = files
+    log_games(log, 0, 2)
+    run(files)
+    log_games(log, 2, 3)
+    crash_while_writing(files, monkeypatch, 10)
+    with open(store, "a", newline="") as f:
+        f.write("someone else's row\n")
+    size = store.stat().st_size
+    with pytest.raises(ValueError):
+        run(files)
+    assert store.stat().st_size == size
+    assert json.loads(checkpoint.read_text())["pending"] is not None
+
+
+def test_large_runs_are_written_in_batches(files, monkeypatch):
+    log, store, _ = files
+    monkeypatch.setattr(sessionizer, "STORE_BATCH_ROWS", 4)
+    log_games(log, 0, 10)
+    assert run(files)["games"] == 10
+    assert len(store_rows(store)) == 1 + 10
+
+
+@pytest.mark.parametrize("level", ["Easy", "Medium", "Hard"])
+def test_cli_games_pass_stats_validation(tmp_path, monkeypatch, level):
+    monkeypatch.chdir(tmp_path)
+    code_length = play_game_human_with_logging.DIFFICULTY_SETTINGS[level]["code_length"]
+    monkeypatch.setattr("builtins.input", lambda prompt: "123456"[:code_length])
+    for _ in range(3):
+        play_game_human_with_logging.play_game(level)
+    assert sessionize()["games"] == 3
+    report = validate_game_stats()
+    assert report["games"] == 3 and report["invalid_games"] == 0, report
+    assert {row[0] for row in store_rows(tmp_path / "game_stats.csv")[1:]} == {level}
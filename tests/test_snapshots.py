@@ -0,0 +1,71 @@
+"""Game and solver snapshots: byte round trips across backends, and rejected inputs."""
+import pytest
+
+from CodeCrackGame import SNAPSHOT_HEADER, CodeCrackGame
+from codecrack_engine import (ALL_CANDIDATES, FEEDBACK_BACKENDS, SOLVER_SNAPSHOT_HEADER, CodeCrackSolver,
+                              score)
+
+SECRET = "3146"
+GUESSES = ["1234", "5612", "4163"]
+BACKENDS = [name for name, cls in FEEDBACK_BACKENDS.items() if cls.available()]
+
+
+def played_solver(backend, moves):
+    solver = CodeCrackSolver(4, "123456", False, backend=backend)
+    for guess in GUESSES[:moves]:
+        solver.filter(guess, *score(guess, SECRET))
+    return solver
+
+
+def state(solver):
+    return [int(i) for i in solver.candidates], solver.history
+
+
+@pytest.mark.parametrize("moves", [0, 1, len(GUESSES)])
+@pytest.mark.parametrize("saved_with", BACKENDS)
+def test_solver_restores_on_every_backend(saved_with, moves):
+    saved = played_solver(saved_with, moves)
+    data = saved.to_bytes()
+    for backend in BACKENDS:  # List candidates to array candidates and back
+        restored = CodeCrackSolver.from_bytes(data, backend=backend)
+        assert restored.backend.name == backend
+        assert state(restored) == state(saved)
+        assert restored.to_bytes() == data
+        assert restored.next_guess() == saved.next_guess()
+
+
+def test_solver_before_first_guess_stores_no_candidates():
+    data = played_solver("python", 0).to_bytes()
+    assert SOLVER_SNAPSHOT_HEADER.unpack_from(data)[-1] == ALL_CANDIDATES
+    assert len(data) == SOLVER_SNAPSHOT_HEADER.size + len("123456")
+    restored = CodeCrackSolver.from_bytes(data)
+    assert len(restored.candidates) == len(restored.space)
+
+
+def test_game_round_trip():
+    game = CodeCrackGame(code_length=4, allow_duplicates=False)
+    game.secret_code = SECRET
+    for guess in GUESSES + [SECRET]:
+        game.make_guess(guess)
+    restored = CodeCrackGame.from_bytes(game.to_bytes())
+    for name in CodeCrackGame.__slots__:
+        assert getattr(restored, name) == getattr(game, name), name
+
+
+@pytest.mark.parametrize("field", [0, 1], ids=["magic", "version"])
+def test_wrong_magic_or_version_is_rejected(field):
+    game_data = bytearray(CodeCrackGame().to_bytes())
+    solver_data = bytearray(played_solver("python", 1).to_bytes())
+    position = 0 if field == 0 else 4  # Both headers start with a 4-byte magic and a version byte
+    game_data[position] ^= 0xFF
+    solver_data[position] ^= 0xFF
+    with pytest.raises(ValueError):
+        CodeCrackGame.from_bytes(bytes(game_data))
+    with pytest.raises(ValueError):
+        CodeCrackSolver.from_bytes(bytes(solver_data))
+
+
+def test_too_many_guesses_for_a_snapshot():
+    assert SNAPSHOT_HEADER.unpack_from(CodeCrackGame(max_guesses=255).to_bytes())[3] == 255
+    with pytest.raises(ValueError):
+        CodeCrackGame(max_guesses=256).to_bytes()
@@ -0,0 +1,46 @@
+"""Solver guesses: time budgets and results."""
+import random
+import time
+
+from codecrack_engine import CodeCrackSolver, MultiCodeSolver, score
+
+HARD = ("123456", 6, True)
+BUDGET = 0.05
+SLACK = 4  # elapsed time allowed per unit of budget, for slow CI machines
+
+
+def timed(call):
+    start = time.perf_counter()
+    result = call()
+    return result, time.perf_counter() - start
+
+
+def test_sampled_guess_respects_budget_on_hard():
+    digits, code_length, allow_duplicates = HARD
+    solver = CodeCrackSolver(code_length, digits, allow_duplicates)
+    solver.filter("112233", *score("112233", "321456"))
+    remaining = set(solver.all_possible)
+    for seed in range(3):
+        guess, elapsed = timed(lambda: solver.sampled_guess(BUDGET, random.Random(seed)))
+        assert elapsed < SLACK * BUDGET, elapsed
+        assert guess in remaining
+
+
+def test_sampled_guess_is_exhaustive_on_small_sets():
+    solver = CodeCrackSolver(4, "123456", False)
+    solver.filter("1234", *score("1234", "3146"))  # 88 candidates: several rounds of SAMPLE_GUESSES
+    candidates = list(solver.candidates)
+    exact = list(solver.backend.partition_scores(candidates, candidates))
+    guesses = {solver.sampled_guess(time_budget=60, rng=random.Random(seed)) for seed in range(5)}
+    for guess in guesses:
+        assert exact[solver.all_possible.index(guess)] == min(exact)
+    first = solver.sampled_guess(time_budget=60, rng=random.Random(7))
+    assert solver.sampled_guess(time_budget=60, rng=random.Random(7)) == first
+
+
+def test_multi_code_opening_respects_budget():
+    digits, code_length, allow_duplicates = HARD
+    solver = MultiCodeSolver(8, code_length, digits, allow_duplicates)
+    guess, elapsed = timed(lambda: solver.sampled_guess(BUDGET, random.Random(0)))
+    assert elapsed < SLACK * BUDGET, elapsed
+    assert guess in solver.space.codes
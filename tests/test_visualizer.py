@@ -0,0 +1,37 @@
+"""Headless reports from the game log."""
+import os
+
+import pytest
+
+pytest.importorskip("matplotlib")
+import game_data_visualizer  # noqa: E402
+from game_data_visualizer import render_report, summarize_results  # noqa: E402
+
+HEADER = "Guess,Correct,Misplaced,SecretCode,NumGuesses,Win\n"
+ROWS = ["1243,2,2,1234,2,False\n", "1234,4,0,1234,2,True\n"]
+
+
+def write_log(path, rows):
+    path.write_text(HEADER + "".join(rows))
+    return str(path)
+
+
+def test_header_only_log_renders(tmp_path):
+    summary = summarize_results(write_log(tmp_path / "empty.csv", []))
+    assert summary["rows"] == 0 and summary["correct_stats"] == {}
+    paths = render_report(summary, str(tmp_path / "reports"))
+    assert all(os.path.getsize(path) for path in paths)
+    with open(paths[-1], encoding="utf-8") as f:
+        assert "<table" not in f.read()
+
+
+def test_unwritable_cache_still_returns_summary(tmp_path, monkeypatch):
+    log = write_log(tmp_path / "log.csv", ROWS)
+
+    def read_only(*args):
+        raise PermissionError("read-only directory")
+
+    monkeypatch.setattr(game_data_visualizer.os, "replace", read_only)
+    summary = summarize_results(log)
+    assert summary["rows"] == 2 and summary["win_counts"] == {"False": 1, "True": 1}
+    assert not os.path.exists(log + ".summary.json") and not os.path.exists(log + ".summary.json.tmp")